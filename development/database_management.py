@@ -7,9 +7,24 @@ from datetime import datetime, date, timedelta
 import calendar
 import json
 import os
+import re
+import threading
+from contextlib import contextmanager
 from calendar_popup import CalendarDialog
 from typing import Dict, List, Tuple
 
+# "HH:MM" (hour may be a single digit), compiled once for all time entries
+_HHMM = re.compile(r'^([01]?\d|2[0-3]):([0-5]\d)$')
+
+
+def parse_hhmm(value):
+    """Return minutes since midnight for an 'HH:MM' string, or None if it is not a valid time"""
+    match = _HHMM.match(value)
+    if not match:
+        return None
+    return int(match.group(1)) * 60 + int(match.group(2))
+
+
 # =============================================================================
 # DATABASE SETUP
 # =============================================================================
@@ -22,6 +37,8 @@ class DatabaseManager:
             project_root = os.path.dirname(script_dir)  # Go up one level from development to project root
             db_name = os.path.join(project_root, "data", "employee_time.db") # ./../data/employee_time.db
         self.db_name = db_name
+        # One long-lived read connection per thread, see _shared_connection
+        self._local = threading.local()
         self.init_database()
 
     def init_database(self):
@@ -31,6 +48,8 @@ class DatabaseManager:
 
         conn = sqlite3.connect(self.db_name)
         cursor = conn.cursor()
+        # WAL is stored in the database file, so every later connection uses it too
+        cursor.execute("PRAGMA journal_mode=WAL")
 
         # Employees table
         cursor.execute('''
@@ -89,6 +108,12 @@ class DatabaseManager:
             )
         ''')
 
+        # Time records are almost always read per employee, for a date range, often for one record type
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_tr_emp_date_type
+            ON time_records (employee_id, date, record_type)
+        ''')
+
         # Settings table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS settings (
@@ -169,7 +194,45 @@ class DatabaseManager:
         conn.close()
     
     def get_connection(self):
-        return sqlite3.connect(self.db_name)
+        conn = sqlite3.connect(self.db_name)
+        # Safe with WAL: a commit no longer waits for an fsync of the database file
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _shared_connection(self):
+        """Long-lived connection of the calling thread, used for quick lookups from the UI"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Room for every distinct UI query, so each is prepared only once per thread
+            conn = sqlite3.connect(self.db_name, cached_statements=256)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def cursor(self):
+        """Yield a cursor on the shared connection; only the cursor is closed afterwards"""
+        cursor = self._shared_connection().cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+
+    def execute_one(self, sql, args=()):
+        """Run a read query on the shared connection and return the first row or None"""
+        return self._shared_connection().execute(sql, args).fetchone()
+
+    def execute_all(self, sql, args=()):
+        """Run a read query on the shared connection and return all rows"""
+        return self._shared_connection().execute(sql, args).fetchall()
+
+    def execute_write(self, sql, args=()):
+        """Run a write statement on the shared connection, commit it and return the affected row count"""
+        conn = self._shared_connection()
+        with conn:
+            return conn.execute(sql, args).rowcount
 
 # =============================================================================
 # EMPLOYEE MANAGEMENT CLASS
@@ -178,6 +241,15 @@ class DatabaseManager:
 class EmployeeManager:
     def __init__(self, db_manager):
         self.db = db_manager
+        # get_all_employees results keyed by include_inactive; cleared on every write
+        self._emp_cache = {}
+        # Bumped on every write so views can tell whether what they show is still current
+        self.version = 0
+
+    def invalidate_cache(self):
+        """Forget cached employee lists after the employees table changed"""
+        self.version += 1
+        self._emp_cache.clear()
     
     def add_employee(self, name, employee_id, position="", hourly_rate=0.0, 
                     email="", hours_per_week=40.0, vacation_days=20, sick_days=10):
@@ -192,6 +264,7 @@ class EmployeeManager:
             ''', (name, employee_id, position, hourly_rate, email, date.today(), 
                   hours_per_week, vacation_days, sick_days))
             conn.commit()
+            self.invalidate_cache()
             return True, "Employee added successfully"
         except sqlite3.IntegrityError:
             return False, "Employee ID already exists"
@@ -201,8 +274,14 @@ class EmployeeManager:
             conn.close()
     
     def get_all_employees(self, include_inactive=False):
-        """Get all employees (active by default)"""
+        """Get all employees (active by default), served from cache until the next write"""
+        employees = self._emp_cache.get(include_inactive)
+        if employees is not None:
+            return employees
+        version = self.version
+
         conn = self.db.get_connection()
+        conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
         if include_inactive:
@@ -212,6 +291,9 @@ class EmployeeManager:
         
         employees = cursor.fetchall()
         conn.close()
+        # Don't cache a read that raced with a write
+        if version == self.version:
+            self._emp_cache[include_inactive] = employees
         return employees
     
     def update_employee(self, emp_id, **kwargs):
@@ -228,6 +310,7 @@ class EmployeeManager:
             query = f"UPDATE employees SET {set_clause} WHERE id = ?"
             cursor.execute(query, values)
             conn.commit()
+            self.invalidate_cache()
             return True
         except sqlite3.Error as e:
             print(f"Database error: {e}")
@@ -252,6 +335,7 @@ class EmployeeManager:
                 message = "Employee deactivated"
             
             conn.commit()
+            self.invalidate_cache()
             return True, message
         except sqlite3.Error as e:
             conn.rollback()
@@ -266,6 +350,7 @@ class EmployeeManager:
         try:
             cursor.execute('UPDATE employees SET active = 1 WHERE id = ?', (emp_id,))
             conn.commit()
+            self.invalidate_cache()
             return True, "Employee reactivated"
         except sqlite3.Error as e:
             conn.rollback()
@@ -396,9 +481,15 @@ class TimeTracker:
         
     def calculate_period_summary(self, employee_id, start_date, end_date):
         """Calculate summary for any date period"""
+        emp_data = self._get_summary_employee(employee_id)
+        if not emp_data:
+            return None
+
         records = self.get_time_records(employee_id, start_date, end_date)
-        
-        # Get employee settings
+        return self._summarize_records(records, emp_data, start_date, end_date)
+
+    def _get_summary_employee(self, employee_id):
+        """Employee settings used by the summaries, or None if the employee does not exist"""
         conn = self.db.get_connection()
         cursor = conn.cursor()
         cursor.execute('''
@@ -407,10 +498,10 @@ class TimeTracker:
         ''', (employee_id,))
         emp_data = cursor.fetchone()
         conn.close()
-        
-        if not emp_data:
-            return None
-        
+        return emp_data
+
+    def _summarize_records(self, records, emp_data, start_date, end_date):
+        """Build a period summary from time_records rows and the employee settings"""
         hours_per_week, vacation_allowance, sick_allowance, hourly_rate, emp_name = emp_data
         
         summary = {
@@ -434,18 +525,19 @@ class TimeTracker:
             'working_time_violations': 0
         }
         
-        # Process records - updated column indices for new schema
+        # Process records
         for record in records:
-            # New column order: id, employee_id, date, start_time_1, end_time_1, start_time_2, 
+            # Column order: id, employee_id, date, start_time_1, end_time_1, start_time_2,
             # end_time_2, start_time_3, end_time_3, total_break_time, minimum_break_required,
-            # total_time_present, hours_worked, overtime_hours, record_type, notes, max_working_time_compliance
-            record_type = record[14]  # record_type column
-            hours = record[12] or 0.0        # hours_worked column
-            overtime = record[13] or 0.0     # overtime_hours column
+            # break_deficit, total_time_present, hours_worked, overtime_hours, record_type, notes,
+            # break_compliance, max_working_time_compliance
+            record_type = record[15]  # record_type column
+            hours = record[13] or 0.0        # hours_worked column
+            overtime = record[14] or 0.0     # overtime_hours column
             total_break_time = record[9] or 0.0    # total_break_time column
-            time_present = record[11] or 0.0 # total_time_present column
+            time_present = record[12] or 0.0 # total_time_present column
             min_break_req = record[10] or 0.0 # minimum_break_required column
-            max_time_compliance = record[16] # max_working_time_compliance column
+            max_time_compliance = record[18] # max_working_time_compliance column
             
             if record_type == 'work':
                 summary['total_work_hours'] += hours
@@ -474,55 +566,109 @@ class TimeTracker:
         summary['total_pay'] = summary['regular_pay'] + summary['overtime_pay']
         
         return summary
+
+    def calculate_year_and_month_summary(self, employee_id, year, month):
+        """Monthly and yearly summaries from a single read of the year's records.
+
+        Args:
+            employee_id: Employee database id
+            year: Year to summarize
+            month: Month within that year to summarize
+
+        Returns:
+            Tuple (month_summary, year_summary); both None if the employee does not exist.
+            The year summary also carries the vacation/sick allowances and remaining days.
+        """
+        emp_data = self._get_summary_employee(employee_id)
+        if not emp_data:
+            return None, None
+
+        year_start, year_end = date(year, 1, 1), date(year, 12, 31)
+        month_start = date(year, month, 1)
+        month_end = date(year, month, calendar.monthrange(year, month)[1])
+
+        records = self.get_time_records(employee_id, year_start, year_end)
+        month_prefix = month_start.isoformat()[:7]
+        month_records = [record for record in records if str(record[2]).startswith(month_prefix)]
+
+        month_summary = self._summarize_records(month_records, emp_data, month_start, month_end)
+        year_summary = self._summarize_records(records, emp_data, year_start, year_end)
+        self._add_allowances(year_summary, emp_data)
+        return month_summary, year_summary
+
+    @staticmethod
+    def _add_allowances(summary, emp_data):
+        """Add yearly vacation/sick allowances and the days remaining to a summary"""
+        vacation_allowance, sick_allowance = emp_data[1], emp_data[2]
+        summary['vacation_allowance'] = vacation_allowance
+        summary['sick_allowance'] = sick_allowance
+        summary['vacation_days_remaining'] = max(0, vacation_allowance - summary['vacation_days'])
+        summary['sick_days_remaining'] = max(0, sick_allowance - summary['sick_days'])
     
     def calculate_monthly_summary(self, employee_id, year, month):
         """Calculate monthly summary for employee"""
-        from datetime import date, timedelta
-        start_date = date(year, month, 1)
-        if month == 12:
-            end_date = date(year + 1, 1, 1) - timedelta(days=1)
-        else:
-            end_date = date(year, month + 1, 1) - timedelta(days=1)
-        
-        summary = self.calculate_period_summary(employee_id, start_date, end_date)
+        summary, ytd_summary = self.calculate_year_and_month_summary(employee_id, year, month)
         
         if summary:
             # Add year-to-date calculations
-            ytd_summary = self.calculate_yearly_summary(employee_id, year)
-            if ytd_summary:
-                summary['vacation_days_used_ytd'] = ytd_summary['vacation_days']
-                summary['sick_days_used_ytd'] = ytd_summary['sick_days']
-                summary['vacation_days_remaining'] = max(0, ytd_summary['vacation_allowance'] - ytd_summary['vacation_days'])
-                summary['sick_days_remaining'] = max(0, ytd_summary['sick_allowance'] - ytd_summary['sick_days'])
+            summary['vacation_days_used_ytd'] = ytd_summary['vacation_days']
+            summary['sick_days_used_ytd'] = ytd_summary['sick_days']
+            summary['vacation_days_remaining'] = ytd_summary['vacation_days_remaining']
+            summary['sick_days_remaining'] = ytd_summary['sick_days_remaining']
         
         return summary
     
     def calculate_yearly_summary(self, employee_id, year):
         """Calculate yearly summary for employee"""
+        emp_data = self._get_summary_employee(employee_id)
+        if not emp_data:
+            return None
+
         start_date = date(year, 1, 1)
         end_date = date(year, 12, 31)
-        
-        summary = self.calculate_period_summary(employee_id, start_date, end_date)
-        
-        if summary:
-            # Get employee allowances
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT vacation_days_per_year, sick_days_per_year
-                FROM employees WHERE id = ?
-            ''', (employee_id,))
-            allowances = cursor.fetchone()
-            conn.close()
-            
-            if allowances:
-                summary['vacation_allowance'] = allowances[0]
-                summary['sick_allowance'] = allowances[1]
-                summary['vacation_days_remaining'] = max(0, allowances[0] - summary['vacation_days'])
-                summary['sick_days_remaining'] = max(0, allowances[1] - summary['sick_days'])
-        
+        records = self.get_time_records(employee_id, start_date, end_date)
+        summary = self._summarize_records(records, emp_data, start_date, end_date)
+        self._add_allowances(summary, emp_data)
         return summary
     
+    def get_employee_period_totals(self, year, month):
+        """Work totals and absence counts for every employee in one query.
+
+        Args:
+            year: Year for the year-to-date totals
+            month: Month within that year for the monthly totals
+
+        Returns:
+            Dict mapping employee database id to a dict with the keys
+            month_work_hours, month_overtime, month_vacation_days, month_sick_days,
+            ytd_work_hours, ytd_overtime, ytd_vacation_days and ytd_sick_days
+        """
+        year_start, year_end = date(year, 1, 1), date(year, 12, 31)
+        month_start = date(year, month, 1)
+        month_end = date(year, month, calendar.monthrange(year, month)[1])
+
+        conn = self.db.get_connection()
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT e.id,
+                   TOTAL(CASE WHEN t.record_type = 'work' AND t.date BETWEEN :ms AND :me THEN t.hours_worked END) AS month_work_hours,
+                   TOTAL(CASE WHEN t.record_type = 'work' AND t.date BETWEEN :ms AND :me THEN t.overtime_hours END) AS month_overtime,
+                   COUNT(CASE WHEN t.record_type = 'vacation' AND t.date BETWEEN :ms AND :me THEN 1 END) AS month_vacation_days,
+                   COUNT(CASE WHEN t.record_type = 'sick' AND t.date BETWEEN :ms AND :me THEN 1 END) AS month_sick_days,
+                   TOTAL(CASE WHEN t.record_type = 'work' THEN t.hours_worked END) AS ytd_work_hours,
+                   TOTAL(CASE WHEN t.record_type = 'work' THEN t.overtime_hours END) AS ytd_overtime,
+                   COUNT(CASE WHEN t.record_type = 'vacation' THEN 1 END) AS ytd_vacation_days,
+                   COUNT(CASE WHEN t.record_type = 'sick' THEN 1 END) AS ytd_sick_days
+            FROM employees e
+            LEFT JOIN time_records t
+                   ON t.employee_id = e.id AND t.date BETWEEN :ys AND :ye
+            GROUP BY e.id
+        ''', {'ms': month_start, 'me': month_end, 'ys': year_start, 'ye': year_end})
+        totals = {row['id']: dict(row) for row in cursor.fetchall()}
+        conn.close()
+        return totals
+
     def delete_time_record(self, record_id):
         """Delete a time record"""
         conn = self.db.get_connection()
@@ -703,16 +849,29 @@ class TimeTracker:
         Returns:
             dict: Calculated values for database insertion
         """
-        from datetime import datetime, timedelta
-        
-        # Convert time strings to datetime objects for calculation
-        work_periods = []
+        # Convert time strings to (start, end) minute pairs for calculation
+        periods = []
         for i in range(min(len(start_times), len(end_times))):
             if start_times[i] and end_times[i]:
-                start = datetime.strptime(start_times[i], '%H:%M')
-                end = datetime.strptime(end_times[i], '%H:%M')
-                if end > start:
-                    work_periods.append((start, end))
+                start = parse_hhmm(start_times[i])
+                end = parse_hhmm(end_times[i])
+                if start is None or end is None:
+                    raise ValueError(f"Invalid time '{start_times[i]}-{end_times[i]}', expected HH:MM")
+                periods.append((start, end))
+
+        return self.calculate_periods(periods)
+
+    def calculate_periods(self, periods):
+        """
+        Calculate working hours, breaks, and compliance from work periods in minutes
+        
+        Args:
+            periods (list): (start_minute, end_minute) pairs counted from midnight
+            
+        Returns:
+            dict: Calculated values for database insertion
+        """
+        work_periods = [(start, end) for start, end in periods if end > start]
         
         if not work_periods:
             return {
@@ -726,13 +885,13 @@ class TimeTracker:
                 'overtime_hours': 0.0
             }
         
+        starts, ends = zip(*work_periods)
+        
         # Calculate total time present (from first start to last end)
-        first_start = min(period[0] for period in work_periods)
-        last_end = max(period[1] for period in work_periods)
-        total_time_present = (last_end - first_start).total_seconds() / 3600.0
+        total_time_present = (max(ends) - min(starts)) / 60.0
         
         # Calculate actual work time (sum of all work periods)
-        total_work_time = sum((end - start).total_seconds() / 3600.0 for start, end in work_periods)
+        total_work_time = (sum(ends) - sum(starts)) / 60.0
         
         # Calculate break time (time present - actual work time)
         total_break_time = total_time_present - total_work_time
@@ -783,6 +942,27 @@ class SettingsManager:
             db_manager: DatabaseManager instance
         """
         self.db_manager = db_manager
+        # Settings per section ('general', 'company', 'report'); a section is dropped when it is saved
+        self._cache = {}
+
+    def _cached(self, section: str, loader) -> Dict[str, Any]:
+        """
+        Return a copy of a cached settings section, reading it with loader on first use.
+        
+        Args:
+            section: Cache key of the section
+            loader: Method reading the section from the database
+            
+        Returns:
+            Copy of the section dict, safe for the caller to modify
+        """
+        if section not in self._cache:
+            self._cache[section] = loader()
+        return dict(self._cache[section])
+
+    def invalidate_cache(self):
+        """Forget all cached settings, e.g. after the database was changed from elsewhere."""
+        self._cache.clear()
     
     def get_general_settings(self) -> Dict[str, Any]:
         """
@@ -791,6 +971,10 @@ class SettingsManager:
         Returns:
             Dict with setting keys and their values (converted to appropriate types)
         """
+        return self._cached('general', self._read_general_settings)
+
+    def _read_general_settings(self) -> Dict[str, Any]:
+        """Read the general settings from the database."""
         conn = self.db_manager.get_connection()
         cursor = conn.cursor()
         
@@ -826,16 +1010,12 @@ class SettingsManager:
         Returns:
             True if successful, False otherwise
         """
+        self._cache.pop('general', None)
         conn = self.db_manager.get_connection()
         cursor = conn.cursor()
         
         try:
-            for key, value in settings.items():
-                cursor.execute('''
-                    INSERT OR REPLACE INTO settings (key, value, updated_at) 
-                    VALUES (?, ?, CURRENT_TIMESTAMP)
-                ''', (key, str(value)))
-            
+            self._write_general_settings(cursor, settings)
             conn.commit()
             return True
             
@@ -845,6 +1025,14 @@ class SettingsManager:
             return False
         finally:
             conn.close()
+
+    @staticmethod
+    def _write_general_settings(cursor, settings: Dict[str, Any]):
+        """Upsert all general settings with one executemany; the caller commits."""
+        cursor.executemany('''
+            INSERT OR REPLACE INTO settings (key, value, updated_at) 
+            VALUES (?, ?, CURRENT_TIMESTAMP)
+        ''', [(key, str(value)) for key, value in settings.items()])
     
     def get_company_data(self) -> Dict[str, Any]:
         """
@@ -853,6 +1041,10 @@ class SettingsManager:
         Returns:
             Dict with company information, or empty dict if none found
         """
+        return self._cached('company', self._read_company_data)
+
+    def _read_company_data(self) -> Dict[str, Any]:
+        """Read the company data from the database."""
         conn = self.db_manager.get_connection()
         cursor = conn.cursor()
         
@@ -895,26 +1087,12 @@ class SettingsManager:
         Returns:
             True if successful, False otherwise
         """
+        self._cache.pop('company', None)
         conn = self.db_manager.get_connection()
         cursor = conn.cursor()
         
         try:
-            cursor.execute('''
-                INSERT OR REPLACE INTO company_data (
-                    id, companyname, companystreet, companycity, companyphone, companyemail,
-                    company_color_1, company_color_2, company_color_3, updated_at
-                ) VALUES (1, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ''', (
-                company_data.get('companyname', ''),
-                company_data.get('companystreet', ''),
-                company_data.get('companycity', ''),
-                company_data.get('companyphone', ''),
-                company_data.get('companyemail', ''),
-                company_data.get('company_color_1', '#1E40AF'),
-                company_data.get('company_color_2', '#3B82F6'),
-                company_data.get('company_color_3', '#93C5FD')
-            ))
-            
+            self._write_company_data(cursor, company_data)
             conn.commit()
             return True
             
@@ -924,6 +1102,25 @@ class SettingsManager:
             return False
         finally:
             conn.close()
+
+    @staticmethod
+    def _write_company_data(cursor, company_data: Dict[str, str]):
+        """Upsert the single company_data row; the caller commits."""
+        cursor.execute('''
+            INSERT OR REPLACE INTO company_data (
+                id, companyname, companystreet, companycity, companyphone, companyemail,
+                company_color_1, company_color_2, company_color_3, updated_at
+            ) VALUES (1, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        ''', (
+            company_data.get('companyname', ''),
+            company_data.get('companystreet', ''),
+            company_data.get('companycity', ''),
+            company_data.get('companyphone', ''),
+            company_data.get('companyemail', ''),
+            company_data.get('company_color_1', '#1E40AF'),
+            company_data.get('company_color_2', '#3B82F6'),
+            company_data.get('company_color_3', '#93C5FD')
+        ))
     
     def get_report_settings(self) -> Dict[str, Any]:
         """
@@ -932,6 +1129,10 @@ class SettingsManager:
         Returns:
             Dict with report settings, or defaults if none found
         """
+        return self._cached('report', self._read_report_settings)
+
+    def _read_report_settings(self) -> Dict[str, Any]:
+        """Read the report settings from the database."""
         conn = self.db_manager.get_connection()
         cursor = conn.cursor()
         
@@ -976,20 +1177,12 @@ class SettingsManager:
         Returns:
             True if successful, False otherwise
         """
+        self._cache.pop('report', None)
         conn = self.db_manager.get_connection()
         cursor = conn.cursor()
         
         try:
-            cursor.execute('''
-                INSERT OR REPLACE INTO report_settings (
-                    id, lang, template, default_output_path, updated_at
-                ) VALUES (1, ?, ?, ?, CURRENT_TIMESTAMP)
-            ''', (
-                report_settings.get('lang', 'en'),
-                report_settings.get('template', 'color'),
-                report_settings.get('default_output_path', './reports/')
-            ))
-            
+            self._write_report_settings(cursor, report_settings)
             conn.commit()
             return True
             
@@ -999,6 +1192,19 @@ class SettingsManager:
             return False
         finally:
             conn.close()
+
+    @staticmethod
+    def _write_report_settings(cursor, report_settings: Dict[str, str]):
+        """Upsert the single report_settings row; the caller commits."""
+        cursor.execute('''
+            INSERT OR REPLACE INTO report_settings (
+                id, lang, template, default_output_path, updated_at
+            ) VALUES (1, ?, ?, ?, CURRENT_TIMESTAMP)
+        ''', (
+            report_settings.get('lang', 'en'),
+            report_settings.get('template', 'color'),
+            report_settings.get('default_output_path', './reports/')
+        ))
     
     def load_all_settings(self) -> Dict[str, Any]:
         """
@@ -1027,12 +1233,23 @@ class SettingsManager:
         Returns:
             True if all saves successful, False otherwise
         """
-        success = True
-        success &= self.save_general_settings(general_settings)
-        success &= self.save_company_data(company_data)
-        success &= self.save_report_settings(report_settings)
+        self.invalidate_cache()
+        conn = self.db_manager.get_connection()
+        cursor = conn.cursor()
         
-        return success
+        try:
+            self._write_general_settings(cursor, general_settings)
+            self._write_company_data(cursor, company_data)
+            self._write_report_settings(cursor, report_settings)
+            conn.commit()
+            return True
+            
+        except sqlite3.Error as e:
+            print(f"Error saving settings: {e}")
+            conn.rollback()
+            return False
+        finally:
+            conn.close()
     
     def reset_to_defaults(self) -> bool:
         """
@@ -1,9 +1,13 @@
 from datetime import datetime, date, timedelta
+import calendar
 # =============================================================================
 # DATE MANAGER
 # =============================================================================
 class DateManager:
     """Centralized date management for the application"""
+
+    # (year, month) -> number of days, shared by all instances
+    _days_in_month_cache = {}
     
     def __init__(self):
         self.reset_to_today()
@@ -53,15 +57,24 @@ class DateManager:
         self._view_month = month
         self._view_year = year
     
+    def days_in_month(self, year, month):
+        """Get the number of days in a month (cached per year/month)"""
+        days = self._days_in_month_cache.get((year, month))
+        if days is None:
+            days = calendar.monthrange(year, month)[1]
+            self._days_in_month_cache[(year, month)] = days
+        return days
+    
     def set_date_components(self, day, month, year):
         """Set date from individual components with validation"""
-        try:
-            # Validate the date by creating it
-            new_date = date(year, month, day)
-            self._selected_date = new_date
-            return True, ""
-        except ValueError as e:
-            return False, str(e)
+        if not (1 <= month <= 12):
+            return False, "month must be in 1..12"
+        if not (date.min.year <= year <= date.max.year):
+            return False, f"year {year} is out of range"
+        if not (1 <= day <= self.days_in_month(year, month)):
+            return False, "day is out of range for month"
+        self._selected_date = date(year, month, day)
+        return True, ""
     
     def get_date_components(self):
         """Get the selected date as (day, month, year) tuple"""
@@ -1,17 +1,23 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+from tkinter import ttk, messagebox, filedialog, colorchooser
 from tkinter import font
-import sqlite3
 from datetime import datetime, date, timedelta
 import calendar
 import json
 from calendar_popup import CalendarDialog
-from database_management import DatabaseManager, EmployeeManager, TimeTracker, SettingsManager
+from database_management import DatabaseManager, EmployeeManager, TimeTracker, SettingsManager, parse_hhmm
 from date_management import DateManager
 from report_generation import ReportManager
+from report_worker import build_report_preview
 import os
-import threading
+import re
+import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import base64
+import subprocess
+import platform
 try:
     from ttkthemes import ThemedTk, ThemedStyle
     THEMES_AVAILABLE = True
@@ -22,11 +28,143 @@ except ImportError:
     ThemedTk = tk.Tk
     ThemedStyle = ttk.Style
 
+log = logging.getLogger(__name__)
+
+# Input predicates used instead of try/except around int() in form callbacks
+_is_int = re.compile(r'^-?\d+$').match
+
+# Keystroke validation for numeric spinboxes, evaluated by Tcl without calling back into Python
+_DIGITS_VCMD = 'string is digit %P'
+
+# Month names resolved once; calendar.month_name formats through strftime on every lookup
+_MONTH_NAMES = tuple(calendar.month_name)
+
+# Report template ids as stored in the settings table -> template ids used by ReportManager
+_DB_TEMPLATE_TO_ID = {
+    'default': 'default',
+    'black-white': 'latex_bw',
+    'color': 'latex_color'
+}
+# Reverse of _DB_TEMPLATE_TO_ID, used when saving the selected template
+_ID_TO_DB_TEMPLATE = {tid: db_value for db_value, tid in _DB_TEMPLATE_TO_ID.items()}
+
+# Report language as shown in the language combobox <-> code stored in the settings table
+_LANG_DISPLAY_TO_CODE = {'English': 'en', 'Deutsch': 'de'}
+_LANG_CODE_TO_DISPLAY = {code: display for display, code in _LANG_DISPLAY_TO_CODE.items()}
+
+# Application icon, resolved next to this script (development folder)
+_ICON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "pictures", "main_logo.png")
+
+
+# Rates and hours repeat across employees and refreshes, so their display strings are memoized
+@lru_cache(maxsize=1024)
+def _fmt_money(value):
+    """Format an amount as euros with two decimals"""
+    return f"€{value:.2f}"
+
+
+@lru_cache(maxsize=1024)
+def _fmt_hours(value):
+    """Format an hour value with one decimal"""
+    return f"{value:.1f}"
+
+
+def _hhmm_sql(column):
+    """SQL expression formatting a fractional hour column as H:MM, or an em dash when empty"""
+    return (f"CASE WHEN COALESCE({column}, 0) = 0 THEN '—' "
+            f"ELSE printf('%d:%02d', CAST({column} * 60 AS INTEGER) / 60, CAST({column} * 60 AS INTEGER) % 60) END")
+
+
+def _period_sql(n):
+    """SQL expression for one "start-end" time period, NULL unless both times are set"""
+    return f"NULLIF(start_time_{n}, '') || '-' || NULLIF(end_time_{n}, '')"
+
+
+# Report preview builder script, see _run_external_report_worker
+_REPORT_WORKER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "report_worker.py")
+
+# Text of the time record detail window; filled from a _SQL_DAY_RECORD row plus display values
+_TIME_DETAIL_TEMPLATE = """Date: {date}
+        Employee: {employee}
+
+        Time Periods:
+        {periods}
+        Time Summary:
+          Total Present: {total_time_present:.2f} hours
+          Hours Worked: {hours_worked:.2f} hours
+          Break Time: {total_break_time:.2f} hours
+          Overtime: {overtime_hours:.2f} hours
+
+        German Labor Law Compliance:
+          Minimum Break Required: {minimum_break_required:.2f} hours
+          Break Deficit: {break_deficit:.2f} hours
+          Break Compliance: {break_status}
+          Working Time Compliance: {time_status}
+
+        Record Information:
+          Type: {type}
+          Notes: {notes}
+
+        Created: {created_at}
+        Updated: {updated_at}
+        """
+
+# Employee combobox entries read "Name (employee_id)"; the id is the last parenthesized part
+_EMP_ID_RE = re.compile(r'^.*\(([^)]+)\)\s*$')
+
+
+def _parse_emp_id(text):
+    """employee_id from a "Name (employee_id)" combobox entry, or None if the text has no id"""
+    match = _EMP_ID_RE.match(text)
+    return match.group(1).strip() if match else None
+
+
+# Existence check for an employee row id not yet in the employee cache
+_SQL_EMPLOYEE_DB_ID = "SELECT id FROM employees WHERE id = ?"
+
+# Time records of one employee on one date
+_SQL_DAY_RECORD = '''
+    SELECT start_time_1, end_time_1, start_time_2, end_time_2, start_time_3, end_time_3,
+           total_break_time, minimum_break_required, break_deficit, total_time_present,
+           hours_worked, overtime_hours, record_type, notes,
+           break_compliance, max_working_time_compliance, created_at, updated_at
+    FROM time_records WHERE employee_id = ? AND date = ? LIMIT 1
+'''
+_SQL_DELETE_DAY_RECORDS = "DELETE FROM time_records WHERE employee_id = ? AND date = ?"
+
+# Time tracking treeview rows for one employee and date range, formatted by SQLite:
+# date, time periods, present, worked, breaks, overtime, type, compliance, notes
+_SQL_MONTH_ROWS = f'''
+    SELECT strftime('%d.%m', date),
+           COALESCE(NULLIF(LTRIM(COALESCE({_period_sql(1)}, '')
+                                 || COALESCE(', ' || {_period_sql(2)}, '')
+                                 || COALESCE(', ' || {_period_sql(3)}, ''), ', '), ''), '—'),
+           {_hhmm_sql('total_time_present')},
+           {_hhmm_sql('hours_worked')},
+           {_hhmm_sql('total_break_time')},
+           {_hhmm_sql('overtime_hours')},
+           COALESCE(upper(substr(NULLIF(record_type, ''), 1, 1)) || substr(record_type, 2), 'Work'),
+           COALESCE(NULLIF(LTRIM(
+               CASE WHEN COALESCE(break_compliance, 0) = 0 AND break_deficit > 0
+                    THEN 'Break -' || CAST(break_deficit * 60 AS INTEGER) || 'min' ELSE '' END
+               || CASE WHEN COALESCE(max_working_time_compliance, 0) = 0 THEN ', Work time' ELSE '' END,
+               ', '), ''), '✓ OK'),
+           COALESCE(NULLIF(notes, ''), '—')
+    FROM time_records
+    WHERE employee_id = ?
+    AND date >= ? AND date < ?
+    ORDER BY date
+'''
+
+
 # =============================================================================
 # MAIN APPLICATION GUI
 # =============================================================================
 
 class EmployeeTimeApp:
+
+    # Decoded once and shared by every window of the application
+    _icon = None
     
  # =============================================================================
  # INITIALIZATION & SETUP METHODS
@@ -48,16 +186,16 @@ class EmployeeTimeApp:
         # Get the directory where this script is located (development folder)
         self.script_dir = os.path.dirname(os.path.abspath(__file__))
 
-        # Load the image file using relative path from script directory
-        icon_path = os.path.join(self.script_dir, "resources", "pictures", "main_logo.png")
-        if os.path.exists(icon_path):
+        # Load the application icon (decoded only on first use)
+        if EmployeeTimeApp._icon is None and os.path.exists(_ICON_PATH):
             try:
-                icon = tk.PhotoImage(file=icon_path)
-                self.root.iconphoto(True, icon)
+                EmployeeTimeApp._icon = tk.PhotoImage(file=_ICON_PATH)
             except Exception as e:
-                print(f"Warning: Could not load icon from {icon_path}: {e}")
-        else:
-            print(f"Warning: Icon file not found at {icon_path}")
+                log.warning("Could not load icon from %s: %s", _ICON_PATH, e)
+        if EmployeeTimeApp._icon is not None:
+            self.root.iconphoto(True, EmployeeTimeApp._icon)
+        elif not os.path.exists(_ICON_PATH):
+            log.warning("Icon file not found at %s", _ICON_PATH)
             
         self.root.geometry("1200x800")
         
@@ -85,24 +223,26 @@ class EmployeeTimeApp:
                 db_path=self.db_manager.db_name,
                 templates_dir = os.path.join(self.script_dir, "resources", "templates")
             )
-            print("\nReport manager initialized successfully")
-            print(f"Database path: {self.db_manager.db_name}")
+            log.debug("Report manager initialized successfully")
+            log.debug("Database path: %s", self.db_manager.db_name)
             
-            current_settings = self.report_manager.get_report_settings()
-            print(f"Current template: {current_settings.get('template', 'default')}")
+            if log.isEnabledFor(logging.DEBUG):
+                current_settings = self.report_manager.get_report_settings()
+                log.debug("Current template: %s", current_settings.get('template', 'default'))
             
         except ImportError as e:
-            print(f"\nWarning: Could not import ReportManager: {e}")
+            log.warning("Could not import ReportManager: %s", e)
             self.report_manager = None
         except Exception as e:
-            print(f"\nWarning: Could not initialize report manager: {e}")
+            log.warning("Could not initialize report manager: %s", e)
             self.report_manager = None   
      
         self.employees_data = []
         self.selected_employee = None
         self.selected_employee_id = None
-        self.current_month = datetime.now().month
-        self.current_year = datetime.now().year
+        now = datetime.now()
+        self.current_month, self.current_year = now.month, now.year
+        self._refresh_employee_cache()
         
         # Style configuration and create widgets
         self.configure_styles()
@@ -129,6 +269,8 @@ class EmployeeTimeApp:
         self.theme_var = tk.StringVar(value="LIGHT")
         self.theme_var.trace('w', self.on_theme_change)
         
+        # Pending after() job for a date component change, see on_date_component_change
+        self._date_component_job = None
         self.day_var.trace('w', self.on_date_component_change)
         self.month_var.trace('w', self.on_date_component_change)
         self.year_var.trace('w', self.on_date_component_change)
@@ -136,6 +278,52 @@ class EmployeeTimeApp:
         self.report_generation_active = False
         self.last_pdf_path = None
 
+        # Treeview rows per (employee, year, month); see _month_records
+        self._month_records_cache = {}
+        self._shown_time_rows = None
+        self._cache_release_delay_ms = 5 * 60 * 1000
+
+        # Employee details tab data, see _get_details_bundle; dropped when employees or records change
+        self._details_bundle = None
+        self._details_bundle_period = None
+        # Standalone employee details window, see _get_details_window
+        self._details_window = None
+        self._details_window_header = None
+        self._details_window_trees = None
+        # Time record detail window, see _get_record_detail_window
+        self._record_detail_window = None
+        self._record_detail_text = None
+        # Pending after() job for a details combobox selection, see _schedule_details_load
+        self._details_load_job = None
+        self._details_load_delay_ms = 150
+        # Pending after() job for the date display while typing, see _schedule_date_display
+        self._date_display_job = None
+
+        # Report tab months with data per employee, see _available_months; dropped when records change
+        self._months_cache = None
+
+        # Report template choices; availability does not change during a session
+        self._template_choices_cache = None
+        # Settings tab values as last loaded or saved, see _collect_settings; None when unknown
+        self._saved_settings = None
+
+        # Set while a language preview refresh is queued for the next idle moment
+        self._preview_pending = False
+
+        # Background workers for database reads; results are applied on the Tk thread
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="db-read")
+        # Callbacks posted by worker threads; only the Tk thread touches Tk, see _drain_ui_queue
+        self._ui_queue = queue.Queue()
+        self._ui_poll_ms = 50
+        self.root.after(self._ui_poll_ms, self._drain_ui_queue)
+        # Interpreter for report previews (e.g. pypy3); unset builds them in this process
+        self._report_python = os.environ.get("CHRONOSTAFF_REPORT_PYTHON")
+        # Report previews and PDF exports; one at a time (see report_generation_active), on a reused worker
+        self._report_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report")
+        self._employee_refresh_seq = 0
+        # (employee_manager.version, include_inactive) currently shown in the employee list
+        self._last_rendered_version = None
+
     def configure_styles(self):
         """Configure custom styles for the application"""
         style = ttk.Style()
@@ -143,6 +331,9 @@ class EmployeeTimeApp:
         style.configure('Title.TLabel', font=('Arial', 14, 'bold'))
         style.configure('Info.TLabel', font=('Arial', 10), foreground='blue')
         style.configure('Error.TLabel', font=('Arial', 10), foreground='red')
+        # Dedicated treeview styles with a fixed row height, so rows need no per-item font measuring
+        style.configure('EmpTree.Treeview', rowheight=22)
+        style.configure('TimeTree.Treeview', rowheight=22)
 
  # =============================================================================
  # MAIN UI CREATION METHODS (TABS & WINDOWS)
@@ -160,6 +351,11 @@ class EmployeeTimeApp:
         self.create_reports_tab()
         self.create_settings_tab()
         self.create_employee_details_tab()
+
+        # Release caches of tabs that stay hidden for a while
+        self._current_tab = self.notebook.tab(self.notebook.select(), 'text')
+        self._cache_release_job = None
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_change)
     
     def create_employees_tab(self):
         """Create employee management tab"""
@@ -188,7 +384,7 @@ class EmployeeTimeApp:
         
         # Treeview for employee list
         columns = ('ID', 'Name', 'Position', 'Hourly Rate', 'Hours/Week', 'Vacation Days', 'Email', 'Status')
-        self.emp_tree = ttk.Treeview(list_frame, columns=columns, show='headings', height=12)
+        self.emp_tree = ttk.Treeview(list_frame, columns=columns, show='headings', height=12, style='EmpTree.Treeview')
         
         # Configure columns
         column_widths = {
@@ -232,7 +428,7 @@ class EmployeeTimeApp:
         ttk.Button(right_btn_frame, text="Deactivate", command=self.deactivate_employee).pack(side=tk.LEFT, padx=5)
         ttk.Button(right_btn_frame, text="Reactivate", command=self.reactivate_employee).pack(side=tk.LEFT, padx=5)
         ttk.Button(right_btn_frame, text="Delete Permanently", command=self.delete_employee).pack(side=tk.LEFT, padx=5)
-        ttk.Button(right_btn_frame, text="Refresh", command=self.refresh_employee_list).pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Button(right_btn_frame, text="Refresh", command=lambda: self.refresh_employee_list(force=True)).pack(side=tk.LEFT, padx=(5, 0))
         
         self.refresh_employee_list()
     
@@ -255,7 +451,8 @@ class EmployeeTimeApp:
 
         ttk.Label(emp_row, text="Employee:").pack(side=tk.LEFT)
         self.emp_var = tk.StringVar()
-        self.emp_combo = ttk.Combobox(emp_row, textvariable=self.emp_var, width=40, state="readonly")
+        self.emp_combo = ttk.Combobox(emp_row, textvariable=self.emp_var, width=40, state="readonly",
+                                      postcommand=self._lazy_fill_emp_combo)
         self.emp_combo.pack(side=tk.LEFT, padx=(5, 20))
         self.emp_combo.bind('<<ComboboxSelected>>', self.on_employee_select)
 
@@ -284,20 +481,21 @@ class EmployeeTimeApp:
         ttk.Label(date_input_frame, text="Date:").pack(side=tk.LEFT)
 
         # Date entry fields
-        self.day_var = tk.IntVar(value=date.today().day)
-        self.date_month_var = tk.IntVar(value=date.today().month)
-        self.date_year_var = tk.IntVar(value=date.today().year)
+        today = date.today()
+        self.day_var = tk.IntVar(value=today.day)
+        self.date_month_var = tk.IntVar(value=today.month)
+        self.date_year_var = tk.IntVar(value=today.year)
 
         # Date spinboxes
-        self.day_spin = tk.Spinbox(date_input_frame, from_=1, to=31, textvariable=self.day_var, width=4)
+        self.day_spin = tk.Spinbox(date_input_frame, from_=1, to=31, textvariable=self.day_var, width=4, validate='key', validatecommand=_DIGITS_VCMD)
         self.day_spin.pack(side=tk.LEFT, padx=(15, 2))
         ttk.Label(date_input_frame, text="/").pack(side=tk.LEFT)
 
-        self.month_spin = tk.Spinbox(date_input_frame, from_=1, to=12, textvariable=self.date_month_var, width=4)
+        self.month_spin = tk.Spinbox(date_input_frame, from_=1, to=12, textvariable=self.date_month_var, width=4, validate='key', validatecommand=_DIGITS_VCMD)
         self.month_spin.pack(side=tk.LEFT, padx=2)
         ttk.Label(date_input_frame, text="/").pack(side=tk.LEFT)
 
-        self.year_spin = tk.Spinbox(date_input_frame, from_=2020, to=2030, textvariable=self.date_year_var, width=6)
+        self.year_spin = tk.Spinbox(date_input_frame, from_=2020, to=2030, textvariable=self.date_year_var, width=6, validate='key', validatecommand=_DIGITS_VCMD)
         self.year_spin.pack(side=tk.LEFT, padx=2)
 
         # Calendar buttons
@@ -310,9 +508,9 @@ class EmployeeTimeApp:
         time_entries_frame = ttk.LabelFrame(entry_frame, text="Work Time Periods (Max 3)")
         time_entries_frame.pack(fill=tk.X, padx=10, pady=5)
 
-        # Initialize time entry variables
-        self.start_time_vars = [tk.StringVar() for _ in range(3)]
-        self.end_time_vars = [tk.StringVar() for _ in range(3)]
+        # Time entry widgets, read directly when a preview or entry is made
+        self.start_entries = [None] * 3
+        self.end_entries = [None] * 3
 
         # Create 3 rows for time entries
         for i in range(3):
@@ -322,12 +520,14 @@ class EmployeeTimeApp:
             ttk.Label(time_row, text=f"Period {i+1}:", width=10).pack(side=tk.LEFT)
 
             ttk.Label(time_row, text="Start:").pack(side=tk.LEFT, padx=(10, 2))
-            start_entry = ttk.Entry(time_row, textvariable=self.start_time_vars[i], width=8)
+            start_entry = ttk.Entry(time_row, width=8)
             start_entry.pack(side=tk.LEFT, padx=(0, 5))
+            self.start_entries[i] = start_entry
 
             ttk.Label(time_row, text="End:").pack(side=tk.LEFT, padx=(5, 2))
-            end_entry = ttk.Entry(time_row, textvariable=self.end_time_vars[i], width=8)
+            end_entry = ttk.Entry(time_row, width=8)
             end_entry.pack(side=tk.LEFT, padx=(0, 10))
+            self.end_entries[i] = end_entry
 
             # Add time format hint
             if i == 0:
@@ -375,7 +575,7 @@ class EmployeeTimeApp:
         tree_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
         time_columns = ('Date', 'Time Periods', 'Present', 'Worked', 'Breaks', 'Overtime', 'Type', 'Compliance', 'Notes')
-        self.time_tree = ttk.Treeview(tree_container, columns=time_columns, show='headings', height=12)
+        self.time_tree = ttk.Treeview(tree_container, columns=time_columns, show='headings', height=12, style='TimeTree.Treeview')
 
         time_widths = {
             'Date': 80, 
@@ -418,7 +618,7 @@ class EmployeeTimeApp:
         # Bind events
         for widget in [self.day_spin, self.month_spin, self.year_spin]:
             widget.bind('<FocusOut>', lambda e: self.update_date_display())
-            widget.bind('<KeyRelease>', lambda e: self.root.after(100, self.update_date_display))
+            widget.bind('<KeyRelease>', self._schedule_date_display)
 
         # Bind double-click to edit
         self.time_tree.bind('<Double-1>', lambda e: self.edit_time_entry())
@@ -464,14 +664,15 @@ class EmployeeTimeApp:
         row2 = ttk.Frame(controls_frame)
         row2.pack(fill=tk.X, padx=10, pady=5)
         
+        now = datetime.now()
         ttk.Label(row2, text="Month:").pack(side=tk.LEFT)
-        self.report_month_var = tk.IntVar(value=datetime.now().month)
-        self.month_spinbox = tk.Spinbox(row2, from_=1, to=12, textvariable=self.report_month_var, width=5)
+        self.report_month_var = tk.IntVar(value=now.month)
+        self.month_spinbox = tk.Spinbox(row2, from_=1, to=12, textvariable=self.report_month_var, width=5, validate='key', validatecommand=_DIGITS_VCMD)
         self.month_spinbox.pack(side=tk.LEFT, padx=(5, 10))
         
         ttk.Label(row2, text="Year:").pack(side=tk.LEFT)
-        self.report_year_var = tk.IntVar(value=datetime.now().year)
-        self.year_spinbox = tk.Spinbox(row2, from_=2020, to=2030, textvariable=self.report_year_var, width=8)
+        self.report_year_var = tk.IntVar(value=now.year)
+        self.year_spinbox = tk.Spinbox(row2, from_=2020, to=2030, textvariable=self.report_year_var, width=8, validate='key', validatecommand=_DIGITS_VCMD)
         self.year_spinbox.pack(side=tk.LEFT, padx=(5, 20))
         
         btn_container = ttk.Frame(row2)
@@ -611,9 +812,7 @@ class EmployeeTimeApp:
         color1_frame.grid(row=4, column=1, sticky='ew', padx=(5, 20), pady=2)
         self.company_color1_var = tk.StringVar(value="#1E40AF")
         ttk.Entry(color1_frame, textvariable=self.company_color1_var, width=10).pack(side=tk.LEFT)
-        self.color1_preview = tk.Label(color1_frame, text="  ", bg="#1E40AF", width=3, relief="solid", borderwidth=1)
-        self.color1_preview.pack(side=tk.LEFT, padx=(5, 0))
-        ttk.Button(color1_frame, text="Pick", command=lambda: self.pick_color(self.company_color1_var, self.color1_preview)).pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Button(color1_frame, text="Pick", command=lambda: self.pick_color(self.company_color1_var, 0)).pack(side=tk.LEFT, padx=(5, 0))
 
         # Color 2
         ttk.Label(company_grid, text="Secondary Color:").grid(row=4, column=2, sticky='w', pady=2)
@@ -621,9 +820,7 @@ class EmployeeTimeApp:
         color2_frame.grid(row=4, column=3, sticky='ew', padx=5, pady=2)
         self.company_color2_var = tk.StringVar(value="#3B82F6")
         ttk.Entry(color2_frame, textvariable=self.company_color2_var, width=10).pack(side=tk.LEFT)
-        self.color2_preview = tk.Label(color2_frame, text="  ", bg="#3B82F6", width=3, relief="solid", borderwidth=1)
-        self.color2_preview.pack(side=tk.LEFT, padx=(5, 0))
-        ttk.Button(color2_frame, text="Pick", command=lambda: self.pick_color(self.company_color2_var, self.color2_preview)).pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Button(color2_frame, text="Pick", command=lambda: self.pick_color(self.company_color2_var, 1)).pack(side=tk.LEFT, padx=(5, 0))
 
         # Color 3
         ttk.Label(company_grid, text="Accent Color:").grid(row=5, column=0, sticky='w', pady=2)
@@ -631,9 +828,21 @@ class EmployeeTimeApp:
         color3_frame.grid(row=5, column=1, sticky='ew', padx=(5, 20), pady=2)
         self.company_color3_var = tk.StringVar(value="#93C5FD")
         ttk.Entry(color3_frame, textvariable=self.company_color3_var, width=10).pack(side=tk.LEFT)
-        self.color3_preview = tk.Label(color3_frame, text="  ", bg="#93C5FD", width=3, relief="solid", borderwidth=1)
-        self.color3_preview.pack(side=tk.LEFT, padx=(5, 0))
-        ttk.Button(color3_frame, text="Pick", command=lambda: self.pick_color(self.company_color3_var, self.color3_preview)).pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Button(color3_frame, text="Pick", command=lambda: self.pick_color(self.company_color3_var, 2)).pack(side=tk.LEFT, padx=(5, 0))
+
+        # Color preview - one canvas with a swatch per brand color
+        ttk.Label(company_grid, text="Preview:").grid(row=5, column=2, sticky='w', pady=2)
+        self.color_canvas = tk.Canvas(company_grid, width=90, height=20, highlightthickness=0)
+        self.color_canvas.grid(row=5, column=3, sticky='w', padx=5, pady=2)
+        color_vars = [self.company_color1_var, self.company_color2_var, self.company_color3_var]
+        self._color_rects = [
+            self.color_canvas.create_rectangle(i * 30, 0, i * 30 + 28, 19, fill=var.get(), outline='black')
+            for i, var in enumerate(color_vars)
+        ]
+        # Fill currently shown by each swatch, so rewriting an unchanged color skips the redraw
+        self._swatch_colors = [var.get() for var in color_vars]
+        for i, var in enumerate(color_vars):
+            var.trace_add('write', lambda *args, i=i, var=var: self.update_color_swatch(i, var.get()))
 
         # Default settings
         defaults_frame = ttk.LabelFrame(main_container, text="Default Settings")
@@ -668,7 +877,25 @@ class EmployeeTimeApp:
         ttk.Button(settings_btn_frame, text="Save Settings", command=self.save_settings).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(settings_btn_frame, text="Reset to Defaults", command=self.reset_settings).pack(side=tk.LEFT)
         ttk.Button(settings_btn_frame, text="Load Settings", command=self.load_settings).pack(side=tk.LEFT, padx=(10, 0))
-        self.load_settings()    
+
+        # (section, key, variable, default) for every plain field load_settings fills in
+        self._settings_fields = [
+            ('general', 'standard_hours_per_day', self.std_hours_var, 8.0),
+            ('general', 'overtime_threshold', self.overtime_threshold_var, 40.0),
+            ('general', 'vacation_days_per_year', self.default_vacation_var, 20),
+            ('general', 'sick_days_per_year', self.default_sick_var, 10),
+            ('company', 'companyname', self.company_name_var, 'Meine Firma GmbH'),
+            ('company', 'companystreet', self.company_street_var, 'Geschäftsstraße 123'),
+            ('company', 'companycity', self.company_city_var, '10115 Berlin'),
+            ('company', 'companyphone', self.company_phone_var, '+49-30-1234567'),
+            ('company', 'companyemail', self.company_email_var, 'contact@meinefirma.com'),
+            # Swatches follow the color variables via traces
+            ('company', 'company_color_1', self.company_color1_var, '#1E40AF'),
+            ('company', 'company_color_2', self.company_color2_var, '#3B82F6'),
+            ('company', 'company_color_3', self.company_color3_var, '#93C5FD'),
+            ('report', 'default_output_path', self.template_output_var, './reports/'),
+        ]
+        self.load_settings()
 
     def create_employee_details_tab(self):
         """Create a tab to display detailed employee information"""
@@ -689,10 +916,11 @@ class EmployeeTimeApp:
             selection_frame, 
             textvariable=self.details_emp_var, 
             width=30,
-            state='readonly'
+            state='readonly',
+            postcommand=self._lazy_fill_details_combo
         )
         self.details_emp_combo.pack(side=tk.LEFT, padx=5)
-        self.details_emp_combo.bind('<<ComboboxSelected>>', self.load_employee_details)
+        self.details_emp_combo.bind('<<ComboboxSelected>>', self._schedule_details_load)
 
         # Refresh button
         ttk.Button(
@@ -709,99 +937,60 @@ class EmployeeTimeApp:
         personal_frame = ttk.Frame(details_notebook)
         details_notebook.add(personal_frame, text="Personal Info")
 
-        # Create labels for personal info
-        self.personal_info_labels = {
-            'Name': ttk.Label(personal_frame, text="Name:"),
-            'Employee ID': ttk.Label(personal_frame, text="Employee ID:"),
-            'Position': ttk.Label(personal_frame, text="Position:"),
-            'Hourly Rate': ttk.Label(personal_frame, text="Hourly Rate:"),
-            'Email': ttk.Label(personal_frame, text="Email:"),
-            'Hire Date': ttk.Label(personal_frame, text="Hire Date:"),
-            'Status': ttk.Label(personal_frame, text="Status:")
-        }
-
-        # Corresponding value labels
-        self.personal_info_values = {
-            'Name': ttk.Label(personal_frame, text="", foreground='blue'),
-            'Employee ID': ttk.Label(personal_frame, text="", foreground='blue'),
-            'Position': ttk.Label(personal_frame, text="", foreground='blue'),
-            'Hourly Rate': ttk.Label(personal_frame, text="", foreground='blue'),
-            'Email': ttk.Label(personal_frame, text="", foreground='blue'),
-            'Hire Date': ttk.Label(personal_frame, text="", foreground='blue'),
-            'Status': ttk.Label(personal_frame, text="", foreground='blue')
-        }
-
-        # Grid layout for personal info
-        for i, (key, label) in enumerate(self.personal_info_labels.items()):
-            label.grid(row=i, column=0, sticky='w', padx=5, pady=5)
-            self.personal_info_values[key].grid(row=i, column=1, sticky='w', padx=5, pady=5)
+        # Personal info as a two-column property grid
+        self.personal_info_tree = self._build_property_grid(
+            personal_frame,
+            ('Name', 'Employee ID', 'Position', 'Hourly Rate', 'Email', 'Hire Date', 'Status')
+        )
 
         # Work Details Tab
         work_frame = ttk.Frame(details_notebook)
         details_notebook.add(work_frame, text="Work Details")
 
-        # Work details labels
-        self.work_info_labels = {
-            'Hours/Week': ttk.Label(work_frame, text="Hours/Week:"),
-            'Vacation Days/Year': ttk.Label(work_frame, text="Vacation Days/Year:"),
-            'Sick Days/Year': ttk.Label(work_frame, text="Sick Days/Year:"),
-            'Vacation Days Remaining': ttk.Label(work_frame, text="Vacation Days Remaining:"),
-            'Sick Days Remaining': ttk.Label(work_frame, text="Sick Days Remaining:")
-        }
-
-        # Work details values
-        self.work_info_values = {
-            'Hours/Week': ttk.Label(work_frame, text="", foreground='blue'),
-            'Vacation Days/Year': ttk.Label(work_frame, text="", foreground='blue'),
-            'Sick Days/Year': ttk.Label(work_frame, text="", foreground='blue'),
-            'Vacation Days Remaining': ttk.Label(work_frame, text="", foreground='blue'),
-            'Sick Days Remaining': ttk.Label(work_frame, text="", foreground='blue')
-        }
-
-        # Grid layout for work info
-        for i, (key, label) in enumerate(self.work_info_labels.items()):
-            label.grid(row=i, column=0, sticky='w', padx=5, pady=5)
-            self.work_info_values[key].grid(row=i, column=1, sticky='w', padx=5, pady=5)
+        # Work details as a two-column property grid
+        self.work_info_tree = self._build_property_grid(
+            work_frame,
+            ('Hours/Week', 'Vacation Days/Year', 'Sick Days/Year',
+             'Vacation Days Remaining', 'Sick Days Remaining')
+        )
 
         # Stats Tab
         stats_frame = ttk.Frame(details_notebook)
         details_notebook.add(stats_frame, text="Statistics")
 
         # Current month/year
-        current_month = datetime.now().month
-        current_year = datetime.now().year
-
-        # Stats labels
-        self.stats_labels = {
-            'Current Month': ttk.Label(stats_frame, text=f"{calendar.month_name[current_month]} {current_year}:"),
-            'Work Hours': ttk.Label(stats_frame, text="Work Hours:"),
-            'Overtime': ttk.Label(stats_frame, text="Overtime:"),
-            'Vacation Days': ttk.Label(stats_frame, text="Vacation Days:"),
-            'Sick Days': ttk.Label(stats_frame, text="Sick Days:"),
-            'YTD Work Hours': ttk.Label(stats_frame, text="YTD Work Hours:"),
-            'YTD Overtime': ttk.Label(stats_frame, text="YTD Overtime:")
-        }
+        now = datetime.now()
+        current_month, current_year = now.month, now.year
 
-        # Stats values
-        self.stats_values = {
-            'Work Hours': ttk.Label(stats_frame, text="", foreground='blue'),
-            'Overtime': ttk.Label(stats_frame, text="", foreground='blue'),
-            'Vacation Days': ttk.Label(stats_frame, text="", foreground='blue'),
-            'Sick Days': ttk.Label(stats_frame, text="", foreground='blue'),
-            'YTD Work Hours': ttk.Label(stats_frame, text="", foreground='blue'),
-            'YTD Overtime': ttk.Label(stats_frame, text="", foreground='blue')
-        }
-
-        # Grid layout for stats
-        self.stats_labels['Current Month'].grid(row=0, column=0, sticky='w', padx=5, pady=5)
-        for i, (key, label) in enumerate(self.stats_labels.items()):
-            if key != 'Current Month':
-                label.grid(row=i, column=0, sticky='w', padx=5, pady=5)
-                self.stats_values[key].grid(row=i, column=1, sticky='w', padx=5, pady=5)
+        # Month heading on the first row, statistics below it
+        self.stats_tree = self._build_property_grid(
+            stats_frame,
+            ('Work Hours', 'Overtime', 'Vacation Days', 'Sick Days', 'YTD Work Hours', 'YTD Overtime')
+        )
+        self.stats_tree.insert('', 0, iid='Current Month', text=f"{_MONTH_NAMES[current_month]} {current_year}:")
+        self.stats_tree.configure(height=7)
 
         # Initialize the combo box
         self.update_details_combo()
 
+    @staticmethod
+    def _build_property_grid(frame, keys):
+        """Create a read-only key/value treeview with one row per key (the key is also the row iid)"""
+        tree = ttk.Treeview(frame, columns=('value',), show='tree', selectmode='none', height=len(keys))
+        tree.column('#0', width=200, stretch=False)
+        tree.column('value', width=300, stretch=True)
+        tree.tag_configure('good', foreground='green')
+        tree.tag_configure('bad', foreground='red')
+        for key in keys:
+            tree.insert('', 'end', iid=key, text=f"{key}:", values=('',))
+        tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        return tree
+
+    @staticmethod
+    def _set_property(tree, key, value, tag=None):
+        """Show value in a property grid row; tag is 'good'/'bad' to colour the row"""
+        tree.item(key, values=(value,), tags=(tag,) if tag else ())
+
     def create_report_settings_frame(self, parent):
         """Create report settings section with language and template selection"""
 
@@ -824,45 +1013,9 @@ class EmployeeTimeApp:
         # Template selection
         ttk.Label(template_grid, text="Report Template:").grid(row=1, column=0, sticky='w', pady=2)
 
-        if self.report_manager:
-            # Get available templates and check their availability
-            templates = self.report_manager.get_available_templates()
-            template_choices = []
-            template_mapping = {}
-
-            # Check system capabilities
-            available_methods = self.report_manager.get_available_pdf_methods()
-            latex_available = available_methods.get('latex', False)
-            reportlab_available = available_methods.get('reportlab', False)
-
-            for template in templates:
-                display_name = template['name']
-                template_id = template['id']
-
-                # Add availability and language support indicators
-                lang_support = template.get('languages', ['en'])
-                lang_text = "EN+DE" if len(lang_support) >= 2 else "EN only"
-
-                if template_id in ['latex_bw', 'latex_color'] and not latex_available:
-                    display_name += f" ({lang_text}, ⚠️ Requires LaTeX)"
-                elif template_id == 'default' and not reportlab_available:
-                    display_name += f" ({lang_text}, ⚠️ Requires ReportLab)"
-                elif template_id in ['latex_bw', 'latex_color'] and latex_available:
-                    display_name += f" ({lang_text}, ✅ Available)"
-                elif template_id == 'default' and reportlab_available:
-                    display_name += f" ({lang_text}, ✅ Available)"
-
-                template_choices.append(display_name)
-                template_mapping[display_name] = template_id
-
-            # Store mapping for later use
-            self.template_mapping = template_mapping
-
-        else:
-            template_choices = ['Report Manager Not Available']
-            template_mapping = {}
-
+        template_choices, template_mapping, available_methods = self._get_template_choices()
         self.template_mapping = template_mapping
+        self.template_id_to_display = {tid: display for display, tid in template_mapping.items()}
 
         self.template_display_var = tk.StringVar()
         template_combo = ttk.Combobox(template_grid, textvariable=self.template_display_var, 
@@ -875,7 +1028,6 @@ class EmployeeTimeApp:
 
         # System status info
         if self.report_manager:
-            available_methods = self.report_manager.get_available_pdf_methods()
             info_text = "System status: "
             if available_methods.get('reportlab', False):
                 info_text += "ReportLab ✅ "
@@ -899,26 +1051,16 @@ class EmployeeTimeApp:
 
                 # Set language
                 current_lang = current_settings.get('lang', 'en')
-                if current_lang == 'de':
-                    self.language_var.set('Deutsch')
-                else:
-                    self.language_var.set('English')
+                self.language_var.set(_LANG_CODE_TO_DISPLAY.get(current_lang, 'English'))
 
                 # Set template
                 current_template = current_settings.get('template', 'default')
-                db_to_display = {
-                    'default': 'Default (ReportLab)',
-                    'black-white': 'LaTeX Black & White',
-                    'color': 'LaTeX Color'
-                }
-
-                target_display = db_to_display.get(current_template, 'Default (ReportLab)')
-
-                # Find matching choice (with availability suffix)
-                for choice in template_choices:
-                    if choice.startswith(target_display):
-                        self.template_display_var.set(choice)
-                        break
+                template_id = _DB_TEMPLATE_TO_ID.get(current_template, 'default')
+
+                # Display name includes the availability suffix
+                current_display = self.template_id_to_display.get(template_id)
+                if current_display:
+                    self.template_display_var.set(current_display)
                 else:
                     # If current template not available, set to first available
                     available_choices = [c for c in template_choices if '✅ Available' in c]
@@ -960,9 +1102,51 @@ class EmployeeTimeApp:
         self.language_preview_label.pack(side=tk.LEFT, padx=(5, 0))
 
         # Update preview when language changes
-        self.language_var.trace('w', self.update_language_preview)
+        self.language_var.trace('w', self._schedule_language_preview)
         self.update_language_preview()
 
+    def _get_template_choices(self):
+        """Return (choices, display->id mapping, available PDF methods), computed once per session"""
+        if self._template_choices_cache is not None:
+            return self._template_choices_cache
+
+        if not self.report_manager:
+            self._template_choices_cache = (['Report Manager Not Available'], {}, {})
+            return self._template_choices_cache
+
+        # Get available templates and check their availability
+        templates = self.report_manager.get_available_templates()
+        template_choices = []
+        template_mapping = {}
+
+        # Check system capabilities
+        available_methods = self.report_manager.get_available_pdf_methods()
+        latex_available = available_methods.get('latex', False)
+        reportlab_available = available_methods.get('reportlab', False)
+
+        for template in templates:
+            display_name = template['name']
+            template_id = template['id']
+
+            # Add availability and language support indicators
+            lang_support = template.get('languages', ['en'])
+            lang_text = "EN+DE" if len(lang_support) >= 2 else "EN only"
+
+            if template_id in ['latex_bw', 'latex_color'] and not latex_available:
+                display_name += f" ({lang_text}, ⚠️ Requires LaTeX)"
+            elif template_id == 'default' and not reportlab_available:
+                display_name += f" ({lang_text}, ⚠️ Requires ReportLab)"
+            elif template_id in ['latex_bw', 'latex_color'] and latex_available:
+                display_name += f" ({lang_text}, ✅ Available)"
+            elif template_id == 'default' and reportlab_available:
+                display_name += f" ({lang_text}, ✅ Available)"
+
+            template_choices.append(display_name)
+            template_mapping[display_name] = template_id
+
+        self._template_choices_cache = (template_choices, template_mapping, available_methods)
+        return self._template_choices_cache
+
     def create_theme_settings_section(self, parent):
         """Theme settings"""
         # Theme Settings - Clean & Left-aligned
@@ -1017,61 +1201,110 @@ class EmployeeTimeApp:
  # EMPLOYEE MANAGEMENT METHODS
  # =============================================================================
     
-    def refresh_employee_list(self):
-        print("=== REFRESHING EMPLOYEE LIST ===")
+    def refresh_employee_list(self, force=False):
+        """Reload the employee treeview; rows are read and formatted on a worker thread
 
-        # Clear existing items
-        for item in self.emp_tree.get_children():
-            self.emp_tree.delete(item)
+        Nothing is done when the list already shows the current employee data,
+        unless force is set (which also drops the manager's cached lists).
+        """
+        if force:
+            self.employee_manager.invalidate_cache()
 
-        # Get employees
         include_inactive = self.show_inactive_var.get()
+        version = (self.employee_manager.version, include_inactive)
+        if version == self._last_rendered_version:
+            return
+
+        self._employee_refresh_seq += 1
+        seq = self._employee_refresh_seq
+
+        future = self._io_pool.submit(self._fetch_employee_rows, include_inactive)
+        future.add_done_callback(lambda f: self._post_to_ui(self._apply_employee_rows, seq, version, f))
+
+    def _fetch_employee_rows(self, include_inactive):
+        """Read employees and build their treeview values (runs off the Tk thread)"""
         employees = self.employee_manager.get_all_employees(include_inactive=include_inactive)
-        print(f"Retrieved {len(employees)} employees from database")
+        return [row for row in map(self._format_employee_row, employees) if row is not None]
 
-        for i, emp in enumerate(employees):
-            try:
-                print(f"Processing employee {i+1}:")
-                print(f"  Database ID (emp[0]): {emp[0]}")
-                print(f"  Name (emp[1]): {emp[1]}")
-                print(f"  Employee ID (emp[2]): {emp[2]}")
-                print(f"  Position (emp[3]): {emp[3]}")
-                print(f"  Hourly Rate (emp[4]): {emp[4]}")
-                print(f"  Email (emp[5]): {emp[5]}")
-                print(f"  Hours/Week (emp[7]): {emp[7] if len(emp) > 7 else 'N/A'}")
-                print(f"  Vacation Days (emp[8]): {emp[8] if len(emp) > 8 else 'N/A'}")
-                print(f"  Active (emp[10]): {emp[10] if len(emp) > 10 else 'N/A'}")
-
-                status = "Active" if emp[10] else "Inactive"
-
-                formatted_db_id = f"{emp[0]}"
-
-                values_to_insert = (
-                    formatted_db_id,    # "1", "2", etc.
-                    emp[1],    # name
-                    emp[3] or "",    # position
-                    f"€{emp[4]:.2f}" if emp[4] else "€0.00",  # hourly_rate
-                    f"{emp[7]:.1f}" if emp[7] else "40.0",   # hours_per_week
-                    emp[8] if emp[8] else "20",    # vacation_days_per_year
-                    emp[5] or "",     # email
-                    status
-                )
+    def _apply_employee_rows(self, seq, version, future):
+        """Show fetched employee rows unless a newer refresh has been requested since"""
+        if seq != self._employee_refresh_seq:
+            return
+        try:
+            rows = future.result()
+        except Exception:
+            log.exception("Failed to load employees")
+            messagebox.showerror("Error", "Failed to load employees")
+            return
+        self._bulk_insert(self.emp_tree, rows)
+        self._last_rendered_version = version
 
-                print(f"  Inserting into TreeView: {values_to_insert}")
-                self.emp_tree.insert('', 'end', values=values_to_insert)
+    def _post_to_ui(self, callback, *args):
+        """Queue callback for the Tk thread; safe to call from worker threads, even before mainloop runs"""
+        self._ui_queue.put((callback, args))
 
-            except (IndexError, TypeError) as e:
-                print(f"ERROR processing employee {i+1}: {e}")
-                print(f"Employee data: {emp}")
-                continue
-            
-        print("=== EMPLOYEE LIST REFRESH COMPLETED ===\n")
+    def _drain_ui_queue(self):
+        """Run callbacks posted by worker threads, then poll again"""
+        try:
+            while True:
+                callback, args = self._ui_queue.get_nowait()
+                try:
+                    callback(*args)
+                except Exception:
+                    log.exception("UI callback %s failed", callback)
+        except queue.Empty:
+            pass
+        try:
+            self.root.after(self._ui_poll_ms, self._drain_ui_queue)
+        except tk.TclError:
+            pass  # Main window is gone
+
+    @staticmethod
+    def _format_employee_row(emp):
+        """Build the employee treeview values for one row, or None if the row is malformed"""
+        try:
+            return (
+                f"{emp['id']}",    # "1", "2", etc.
+                emp['name'],
+                emp['position'] or "",
+                _fmt_money(emp['hourly_rate']) if emp['hourly_rate'] else "€0.00",
+                _fmt_hours(emp['hours_per_week']) if emp['hours_per_week'] else "40.0",
+                emp['vacation_days_per_year'] if emp['vacation_days_per_year'] else "20",
+                emp['email'] or "",
+                "Active" if emp['active'] else "Inactive"
+            )
+        except (IndexError, KeyError, TypeError, ValueError) as e:
+            log.warning("Skipping malformed employee row %r: %s", emp, e)
+            return None
 
     def update_employee_combo(self):
-        """Update employee combobox with current employees"""
-        employees = self.employee_manager.get_all_employees()
-        emp_names = [f"{emp[1]} ({emp[2]})" for emp in employees]
-        self.emp_combo['values'] = emp_names
+        """Mark the employee combobox stale; it is refilled when its dropdown next opens"""
+        self._emp_combo_filled = False
+
+    def _lazy_fill_emp_combo(self):
+        """Fill the time tracking employee combobox right before its list is shown"""
+        if not self._emp_combo_filled:
+            self._set_combo_values(self.emp_combo, self._emp_display)
+            self._emp_combo_filled = True
+
+    def _refresh_employee_cache(self):
+        """Read employees once and build the display lists shared by all employee comboboxes"""
+        self._details_bundle = None
+        self._months_cache = None
+        employees = self.employee_manager.get_all_employees(include_inactive=True)
+        active = [emp for emp in employees if emp['active']]
+        self.employees_data = [{'id': emp['id'], 'name': emp['name'], 'employee_id': emp['employee_id']} for emp in active]
+        self._emp_display = [f"{emp['name']} ({emp['employee_id']})" for emp in active]
+        self._emp_display_all = [f"{emp['name']} ({emp['employee_id']})" for emp in employees]
+        self._empid_to_dbid = {emp['employee_id']: emp['id'] for emp in employees}
+        self._known_db_ids = set(self._empid_to_dbid.values())
+
+    def _refresh_all_combos(self):
+        """Reload the employee cache and push it to every employee combobox"""
+        self._refresh_employee_cache()
+        self.update_employee_combo()
+        self.update_report_employee_combo()
+        self.update_details_combo()
     
     def add_employee_dialog(self):
         """Show dialog to add new employee"""
@@ -1133,22 +1366,13 @@ class EmployeeTimeApp:
                 messagebox.showerror("Error", "ID must be a number (digits only)")
                 return
 
-            # Check for duplicate ID
-            conn = self.db_manager.get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM employees WHERE employee_id = ?", (employee_id,))
-            if cursor.fetchone()[0] > 0:
-                messagebox.showerror("Error", f"Employee ID {employee_id} already exists!")
-                conn.close()
-                return
-            conn.close()
-
             # Validate name
             if not name_var.get().strip():
                 messagebox.showerror("Error", "Name is required!")
                 return
 
-            success = self.employee_manager.add_employee(
+            # Duplicate IDs are rejected by the UNIQUE constraint on employee_id
+            success, msg = self.employee_manager.add_employee(
                 name_var.get().strip(),
                 employee_id,
                 pos_var.get().strip(),
@@ -1161,246 +1385,142 @@ class EmployeeTimeApp:
 
             if success:
                 self.refresh_employee_list()
-                self.update_employee_combo()
+                self._refresh_all_combos()
                 dialog.destroy()
                 messagebox.showinfo("Success", f"Employee {employee_id} added successfully!")
+            elif msg == "Employee ID already exists":
+                messagebox.showerror("Error", f"Employee ID {employee_id} already exists!")
             else:
-                messagebox.showerror("Error", "Failed to add employee")
+                messagebox.showerror("Error", msg)
 
         ttk.Button(dialog, text="Save", command=save_employee).grid(row=8, column=0, padx=10, pady=20)
         ttk.Button(dialog, text="Cancel", command=dialog.destroy).grid(row=8, column=1, padx=10, pady=20)
 
-        # Input validation for ID field
-        def validate_id_input(new_val):
-            if not new_val:  # Allow empty field (for backspacing)
-                return True
-            return new_val.isdigit()  # Only allow digits
-
-        vcmd = (dialog.register(validate_id_input), '%P')
-        id_entry.configure(validate='key', validatecommand=vcmd)
+        # Input validation for ID field: digits only, empty allowed for backspacing
+        id_entry.configure(validate='key', validatecommand=_DIGITS_VCMD)
 
     def edit_employee_dialog(self):
         """Show dialog to edit existing employee"""
-        print("=== EDIT EMPLOYEE DIALOG STARTED ===")
-
         selection = self.emp_tree.selection()
-        print(f"TreeView selection: {selection}")
 
         if not selection:
-            print("ERROR: No employee selected in TreeView")
             messagebox.showwarning("Warning", "Please select an employee to edit.")
             return
 
         item = self.emp_tree.item(selection[0])
-        print(f"Selected item data: {item}")
-        print(f"Item values: {item['values']}")
 
         if not item['values'] or len(item['values']) == 0:
-            print("ERROR: No values in selected item")
             messagebox.showerror("Error", "Invalid selection - no data found")
             return
 
         formatted_db_id = item['values'][0]  # e.g., "1"
-        print(f"Formatted DB ID from TreeView: '{formatted_db_id}'")
 
         try:
             database_id = int(formatted_db_id)
-            print(f"Direct conversion database_id: {database_id}")
         except ValueError as e:
-            print(f"ERROR parsing database ID from '{formatted_db_id}': {e}")
+            log.warning("Invalid database ID %r in employee tree: %s", formatted_db_id, e)
             messagebox.showerror("Error", f"Invalid database ID format: {formatted_db_id}")
             return
 
         # Get full employee data from database using database ID
-        print(f"Looking up employee in database with database ID: {database_id}")
-        conn = self.db_manager.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM employees WHERE id = ?", (database_id,))
-        employee = cursor.fetchone()
-        print(f"Database query result: {employee}")
-        conn.close()
+        employee = self.db_manager.execute_one('''
+            SELECT id, name, employee_id,
+                   COALESCE(position, '') AS position,
+                   COALESCE(hourly_rate, 0.0) AS hourly_rate,
+                   COALESCE(email, '') AS email,
+                   COALESCE(hours_per_week, 40.0) AS hours_per_week,
+                   COALESCE(vacation_days_per_year, 20) AS vacation_days_per_year,
+                   COALESCE(sick_days_per_year, 10) AS sick_days_per_year
+            FROM employees WHERE id = ?
+        ''', (database_id,))
 
         if not employee:
-            print(f"ERROR: Employee with database ID {database_id} not found in database")
+            log.warning("Employee with database ID %s not found", database_id)
 
             # Additional debugging - let's see what database IDs actually exist
-            conn = self.db_manager.get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT id, employee_id, name FROM employees")
-            all_employees = cursor.fetchall()
-            print("All employees in database:")
-            for emp in all_employees:
-                print(f"  DB_ID: {emp[0]}, Employee_ID: '{emp[1]}', Name: {emp[2]}")
-            conn.close()
+            if log.isEnabledFor(logging.DEBUG):
+                all_employees = self.db_manager.execute_all("SELECT id, employee_id, name FROM employees LIMIT 20")
+                log.debug("Employees in database (first 20): %s", [tuple(r) for r in all_employees])
 
             messagebox.showerror("Error", "Selected employee not found in database")
             return
 
-        print(f"Employee data retrieved successfully:")
-        print(f"  Database ID: {employee[0]}")
-        print(f"  Name: {employee[1]}")
-        print(f"  Employee ID: {employee[2]}")
-        print(f"  Position: {employee[3]}")
-        print(f"  Hourly Rate: {employee[4]}")
-        print(f"  Email: {employee[5]}")
-        print(f"  Hire Date: {employee[6]}")
-        print(f"  Hours/Week: {employee[7] if len(employee) > 7 else 'N/A'}")
-        print(f"  Vacation Days: {employee[8] if len(employee) > 8 else 'N/A'}")
-        print(f"  Sick Days: {employee[9] if len(employee) > 9 else 'N/A'}")
-        print(f"  Active: {employee[10] if len(employee) > 10 else 'N/A'}")
-        print(f"  Full employee record length: {len(employee)}")
-
         # Create dialog window
-        print("Creating dialog window...")
         dialog = tk.Toplevel(self.root)
-        dialog.title(f"Edit Employee {employee[2]} (DB ID: {database_id})")
+        dialog.title(f"Edit Employee {employee['employee_id']} (DB ID: {database_id})")
         dialog.geometry("400x450")
         dialog.transient(self.root)
         dialog.grab_set()
-        print("Dialog window created successfully")
 
         # Create individual variables for each field
-        print("Creating form variables...")
         try:
-            name_var = tk.StringVar(value=employee[1])
-            print(f"  Name variable set to: '{employee[1]}'")
-
-            position_var = tk.StringVar(value=employee[3] or "")
-            print(f"  Position variable set to: '{employee[3] or ''}'")
-
-            hourly_rate_var = tk.DoubleVar(value=employee[4] or 0.0)
-            print(f"  Hourly rate variable set to: {employee[4] or 0.0}")
-
-            email_var = tk.StringVar(value=employee[5] or "")
-            print(f"  Email variable set to: '{employee[5] or ''}'")
-
-            hours_per_week_var = tk.DoubleVar(value=employee[7] if len(employee) > 7 else 40.0)
-            hours_per_week_value = employee[7] if len(employee) > 7 else 40.0
-            print(f"  Hours/week variable set to: {hours_per_week_value}")
-
-            vacation_days_var = tk.IntVar(value=employee[8] if len(employee) > 8 else 20)
-            vacation_days_value = employee[8] if len(employee) > 8 else 20
-            print(f"  Vacation days variable set to: {vacation_days_value}")
-
-            sick_days_var = tk.IntVar(value=employee[9] if len(employee) > 9 else 10)
-            sick_days_value = employee[9] if len(employee) > 9 else 10
-            print(f"  Sick days variable set to: {sick_days_value}")
-
-            print("All form variables created successfully")
+            name_var = tk.StringVar(value=employee['name'])
+            position_var = tk.StringVar(value=employee['position'])
+            hourly_rate_var = tk.DoubleVar(value=employee['hourly_rate'])
+            email_var = tk.StringVar(value=employee['email'])
+            hours_per_week_var = tk.DoubleVar(value=employee['hours_per_week'])
+            vacation_days_var = tk.IntVar(value=employee['vacation_days_per_year'])
+            sick_days_var = tk.IntVar(value=employee['sick_days_per_year'])
         except Exception as e:
-            print(f"ERROR creating form variables: {e}")
+            log.exception("Failed to initialize edit form")
             messagebox.showerror("Error", f"Failed to initialize form: {e}")
             dialog.destroy()
             return
 
-        # Create form fields with grid layout
-        print("Creating form fields...")
-        row = 0
+        # (label, variable) per form row; the employee ID is shown read-only
+        fields = [
+            ("Name:", name_var),
+            ("Employee ID:", employee['employee_id']),
+            ("Position:", position_var),
+            ("Hourly Rate:", hourly_rate_var),
+            ("Email:", email_var),
+            ("Hours/Week:", hours_per_week_var),
+            ("Vacation Days:", vacation_days_var),
+            ("Sick Days:", sick_days_var),
+        ]
+        row = len(fields)
 
         try:
-            # Name field
-            print(f"  Creating name field at row {row}")
-            ttk.Label(dialog, text="Name:").grid(row=row, column=0, sticky='w', padx=10, pady=5)
-            ttk.Entry(dialog, textvariable=name_var, width=30).grid(row=row, column=1, padx=10, pady=5)
-            row += 1
-
-            print(f"  Creating employee ID field at row {row}")
-            ttk.Label(dialog, text="Employee ID:").grid(row=row, column=0, sticky='w', padx=10, pady=5)
-            ttk.Label(dialog, text=employee[2], foreground='blue').grid(row=row, column=1, sticky='w', padx=10, pady=5)
-            row += 1
-
-            # Position field
-            print(f"  Creating position field at row {row}")
-            ttk.Label(dialog, text="Position:").grid(row=row, column=0, sticky='w', padx=10, pady=5)
-            ttk.Entry(dialog, textvariable=position_var, width=30).grid(row=row, column=1, padx=10, pady=5)
-            row += 1
-
-            # Hourly Rate field
-            print(f"  Creating hourly rate field at row {row}")
-            ttk.Label(dialog, text="Hourly Rate:").grid(row=row, column=0, sticky='w', padx=10, pady=5)
-            ttk.Entry(dialog, textvariable=hourly_rate_var, width=30).grid(row=row, column=1, padx=10, pady=5)
-            row += 1
-
-            # Email field
-            print(f"  Creating email field at row {row}")
-            ttk.Label(dialog, text="Email:").grid(row=row, column=0, sticky='w', padx=10, pady=5)
-            ttk.Entry(dialog, textvariable=email_var, width=30).grid(row=row, column=1, padx=10, pady=5)
-            row += 1
-
-            # Hours/Week field
-            print(f"  Creating hours/week field at row {row}")
-            ttk.Label(dialog, text="Hours/Week:").grid(row=row, column=0, sticky='w', padx=10, pady=5)
-            ttk.Entry(dialog, textvariable=hours_per_week_var, width=30).grid(row=row, column=1, padx=10, pady=5)
-            row += 1
-
-            # Vacation Days field
-            print(f"  Creating vacation days field at row {row}")
-            ttk.Label(dialog, text="Vacation Days:").grid(row=row, column=0, sticky='w', padx=10, pady=5)
-            ttk.Entry(dialog, textvariable=vacation_days_var, width=30).grid(row=row, column=1, padx=10, pady=5)
-            row += 1
-
-            # Sick Days field
-            print(f"  Creating sick days field at row {row}")
-            ttk.Label(dialog, text="Sick Days:").grid(row=row, column=0, sticky='w', padx=10, pady=5)
-            ttk.Entry(dialog, textvariable=sick_days_var, width=30).grid(row=row, column=1, padx=10, pady=5)
-            row += 1
-
-            print("All form fields created successfully")
+            for i, (label, field) in enumerate(fields):
+                ttk.Label(dialog, text=label).grid(row=i, column=0, sticky='w', padx=10, pady=5)
+                if isinstance(field, tk.Variable):
+                    ttk.Entry(dialog, textvariable=field, width=30).grid(row=i, column=1, padx=10, pady=5)
+                else:
+                    ttk.Label(dialog, text=field, foreground='blue').grid(row=i, column=1, sticky='w', padx=10, pady=5)
 
         except Exception as e:
-            print(f"ERROR creating form fields: {e}")
+            log.exception("Failed to create edit form fields")
             messagebox.showerror("Error", f"Failed to create form fields: {e}")
             dialog.destroy()
             return
 
         def save_changes():
-            print("\n=== SAVE CHANGES FUNCTION CALLED ===")
-
             # Validate required fields
             name_value = name_var.get().strip()
-            print(f"Name field value: '{name_value}'")
 
             if not name_value:
-                print("ERROR: Name field is empty")
                 messagebox.showerror("Error", "Name is required!")
                 return
 
             # Get all form values
-            print("Getting form values...")
             try:
                 position_value = position_var.get().strip()
-                print(f"Position: '{position_value}'")
-
                 hourly_rate_value = hourly_rate_var.get()
-                print(f"Hourly rate: {hourly_rate_value}")
-
                 email_value = email_var.get().strip()
-                print(f"Email: '{email_value}'")
-
                 hours_per_week_value = hours_per_week_var.get()
-                print(f"Hours per week: {hours_per_week_value}")
-
                 vacation_days_value = vacation_days_var.get()
-                print(f"Vacation days: {vacation_days_value}")
-
                 sick_days_value = sick_days_var.get()
-                print(f"Sick days: {sick_days_value}")
-
             except Exception as e:
-                print(f"ERROR getting form values: {e}")
                 messagebox.showerror("Error", f"Invalid form values: {e}")
                 return
 
             # Validate numeric fields
-            print("Validating numeric fields...")
             try:
                 hourly_rate = float(hourly_rate_value)
                 hours_per_week = float(hours_per_week_value)
                 vacation_days = int(vacation_days_value)
                 sick_days = int(sick_days_value)
-                print(f"Validated values: rate={hourly_rate}, hours={hours_per_week}, vacation={vacation_days}, sick={sick_days}")
             except ValueError as e:
-                print(f"ERROR: Invalid numeric values - {e}")
                 messagebox.showerror("Error", "Please enter valid numeric values!")
                 return
 
@@ -1414,32 +1534,23 @@ class EmployeeTimeApp:
                 'vacation_days_per_year': vacation_days,
                 'sick_days_per_year': sick_days
             }
-            print(f"Update data prepared: {update_data}")
 
             # Update employee in database using the database ID
-            print(f"Updating employee in database with database ID: {database_id}")
             try:
                 success = self.employee_manager.update_employee(database_id, **update_data)
-                print(f"Update result: {success}")
 
                 if success:
-                    print("Update successful - refreshing UI")
                     self.refresh_employee_list()
-                    self.update_employee_combo()
+                    self._refresh_all_combos()
                     dialog.destroy()
-                    messagebox.showinfo("Success", f"Employee {employee[2]} updated successfully!")
-                    print("=== SAVE CHANGES COMPLETED SUCCESSFULLY ===")
+                    messagebox.showinfo("Success", f"Employee {employee['employee_id']} updated successfully!")
                 else:
-                    print("ERROR: Database update failed")
                     messagebox.showerror("Error", "Failed to update employee in database")
             except Exception as e:
-                print(f"ERROR during database update: {e}")
-                import traceback
-                traceback.print_exc()
+                log.exception("Employee update failed")
                 messagebox.showerror("Error", f"Database error: {str(e)}")
 
         # Button frame
-        print("Creating button frame...")
         btn_frame = ttk.Frame(dialog)
         btn_frame.grid(row=row, column=0, columnspan=2, pady=20)
 
@@ -1449,8 +1560,6 @@ class EmployeeTimeApp:
         # Set focus on the name field
         dialog.after(100, lambda: name_var.get() and dialog.focus_set())
 
-        print("=== EDIT EMPLOYEE DIALOG SETUP COMPLETED ===\n")
-
     def deactivate_employee(self):
         """Deactivate selected employee"""
         emp_id = self._get_selected_employee_db_id()
@@ -1466,6 +1575,7 @@ class EmployeeTimeApp:
             if success:
                 messagebox.showinfo("Success", message)
                 self.refresh_employee_list()
+                self._refresh_all_combos()
             else:
                 messagebox.showerror("Error", message)
 
@@ -1482,6 +1592,7 @@ class EmployeeTimeApp:
             if success:
                 messagebox.showinfo("Success", message)
                 self.refresh_employee_list()
+                self._refresh_all_combos()
             else:
                 messagebox.showerror("Error", message)
 
@@ -1498,84 +1609,100 @@ class EmployeeTimeApp:
             success, message = self.employee_manager.remove_employee(emp_id, permanent=True)
 
             if success:
+                self._invalidate_month_records(emp_id)
                 messagebox.showinfo("Success", message)
                 self.refresh_employee_list()
+                self._refresh_all_combos()
             else:
                 messagebox.showerror("Error", message)
 
     def create_employee_details_window(self):
         """Create a standalone window to display details of the selected employee"""
-        print("=== CREATE EMPLOYEE DETAILS WINDOW STARTED ===")
-        
         # Get selected employee from TreeView
         selection = self.emp_tree.selection()
-        print(f"TreeView selection: {selection}")
+        log.debug("TreeView selection: %s", selection)
         
         if not selection:
-            print("ERROR: No employee selected in TreeView")
+            log.warning("No employee selected in TreeView")
             messagebox.showwarning("Warning", "Please select an employee first.")
             return
     
         item = self.emp_tree.item(selection[0])
-        print(f"Selected item data: {item}")
-        print(f"Item values: {item['values']}")
+        log.debug("Selected item data: %s", item)
+        log.debug("Item values: %s", item['values'])
         
         if not item['values'] or len(item['values']) == 0:
-            print("ERROR: No values in selected item")
+            log.warning("No values in selected item")
             messagebox.showerror("Error", "Invalid selection - no data found")
             return
     
         first_column = item['values'][0]
-        print(f"First column value: '{first_column}'")
+        log.debug("First column value: %r", first_column)
         
         try:
             if isinstance(first_column, str) and first_column.startswith("DB_ID: "):
                 # Parse "DB_ID: 1" format
                 database_id = int(first_column.replace("DB_ID: ", ""))
-                print(f"Parsed database_id from formatted string: {database_id}")
+                log.debug("Parsed database_id from formatted string: %s", database_id)
             else:
                 # Direct conversion (should be the database ID)
                 database_id = int(first_column)
-                print(f"Direct conversion database_id: {database_id}")
+                log.debug("Direct conversion database_id: %s", database_id)
         except ValueError as e:
-            print(f"ERROR parsing database ID from '{first_column}': {e}")
+            log.warning("Could not parse database ID from %r: %s", first_column, e)
             messagebox.showerror("Error", f"Invalid database ID format: {first_column}")
             return
     
         # Get employee data using database ID
-        print(f"Looking up employee in database with database ID: {database_id}")
-        conn = self.db_manager.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM employees WHERE id = ?", (database_id,))
-        employee = cursor.fetchone()
-        print(f"Database query result: {employee}")
-        conn.close()
+        log.debug("Looking up employee in database with database ID: %s", database_id)
+        employee = self.db_manager.execute_one("SELECT * FROM employees WHERE id = ?", (database_id,))
+        log.debug("Database query result: %s", employee)
     
         if not employee:
-            print(f"ERROR: Employee with database ID {database_id} not found in database")
+            log.warning("Employee with database ID %s not found in database", database_id)
             
-            conn = self.db_manager.get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT id, employee_id, name FROM employees")
-            all_employees = cursor.fetchall()
-            print("All employees in database:")
-            for emp in all_employees:
-                print(f"  DB_ID: {emp[0]}, Employee_ID: '{emp[1]}', Name: {emp[2]}")
-            conn.close()
+            if log.isEnabledFor(logging.DEBUG):
+                all_employees = self.db_manager.execute_all("SELECT id, employee_id, name FROM employees LIMIT 20")
+                log.debug("Employees in database (first 20): %s", [tuple(r) for r in all_employees])
             
             messagebox.showerror("Error", "Selected employee not found in database")
             return
     
-        print(f"Employee found: {employee}")
-        print(f"Creating details window for: {employee[1]} ({employee[2]})")
+        log.debug("Employee found: %s", employee)
+        log.debug("Creating details window for: %s (%s)", employee['name'], employee['employee_id'])
     
-        # Create details window
+        # Same rows as the Employee Details tab, taken from the prefetched details bundle
+        details = self._get_details_bundle().get(employee['employee_id'])
+        if not details:
+            # Added outside this session: rebuild the bundle once before giving up
+            self._details_bundle = None
+            details = self._get_details_bundle().get(employee['employee_id'])
+        if not details:
+            log.warning("Employee with employee_id %r not in details bundle", employee['employee_id'])
+            messagebox.showerror("Error", f"Employee {employee['employee_id']} not found in database")
+            return
+        sections = self._employee_detail_rows(employee, details['totals'])
+        year, month = self._details_bundle_period
+
+        details_window, header_label, trees = self._get_details_window(sections)
+        details_window.title(f"Employee Details - {employee['name']} ({employee['employee_id']})")
+        header_label.configure(text=f"{employee['name']} ({employee['employee_id']})")
+        for tree, rows in zip(trees, sections):
+            self._fill_property_grid(tree, rows)
+        trees[2].item('Current Month', text=f"{_MONTH_NAMES[month]} {year}:")
+
+        details_window.deiconify()
+        details_window.lift()
+
+    def _get_details_window(self, sections):
+        """Details window with its header label and property grids; built once, hidden instead of destroyed on close"""
+        if self._details_window is not None and self._details_window.winfo_exists():
+            return self._details_window, self._details_window_header, self._details_window_trees
+
         details_window = tk.Toplevel(self.root)
-        details_window.title(f"Employee Details - {employee[1]} ({employee[2]})")
         details_window.geometry("500x450")
         details_window.transient(self.root)
-        details_window.grab_set()
-        details_window.protocol("WM_DELETE_WINDOW", details_window.destroy)
+        details_window.protocol("WM_DELETE_WINDOW", details_window.withdraw)
     
         container = ttk.Frame(details_window)
         container.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -1583,246 +1710,143 @@ class EmployeeTimeApp:
         header_frame = ttk.Frame(container)
         header_frame.pack(fill=tk.X, pady=(0, 10))
     
-        ttk.Label(header_frame, 
-                 text=f"{employee[1]} ({employee[2]})", 
-                 font=('Arial', 12, 'bold')).pack(side=tk.LEFT)
+        header_label = ttk.Label(header_frame, font=('Arial', 12, 'bold'))
+        header_label.pack(side=tk.LEFT)
     
         ttk.Button(
             header_frame,
             text="Close",
-            command=details_window.destroy
+            command=details_window.withdraw
         ).pack(side=tk.RIGHT)
     
         details_notebook = ttk.Notebook(container)
         details_notebook.pack(fill=tk.BOTH, expand=True)
-    
-        # Personal Info Tab
-        personal_frame = ttk.Frame(details_notebook)
-        details_notebook.add(personal_frame, text="Personal Info")
-    
-        personal_info = [
-            ("Name:", employee[1]),
-            ("Employee ID:", employee[2]),
-            ("Position:", employee[3] if employee[3] else "N/A"),
-            ("Hourly Rate:", f"€{employee[4]:.2f}" if employee[4] else "N/A"),
-            ("Email:", employee[5] if employee[5] else "N/A"),
-            ("Hire Date:", employee[6] if employee[6] else "N/A"),
-            ("Status:", "Active" if employee[10] else "Inactive")
-        ]
-    
-        for row, (label, value) in enumerate(personal_info):
-            ttk.Label(personal_frame, text=label).grid(row=row, column=0, sticky='w', padx=5, pady=5)
-            ttk.Label(personal_frame, text=value, foreground='blue').grid(row=row, column=1, sticky='w', padx=5, pady=5)
-    
-        # Work Details Tab
-        work_frame = ttk.Frame(details_notebook)
-        details_notebook.add(work_frame, text="Work Details")
-    
-        current_year = datetime.now().year
-        start_of_year = date(current_year, 1, 1)
-    
-        print("Calculating vacation and sick days...")
-        conn = self.db_manager.get_connection()
-        cursor = conn.cursor()
-    
-        print(f"Querying vacation days for database_id: {database_id}")
-        cursor.execute('''
-            SELECT COUNT(*) FROM time_records 
-            WHERE employee_id = ? AND date >= ? AND record_type = 'vacation'
-        ''', (database_id, start_of_year)) 
-        vacation_used = cursor.fetchone()[0]
-        print(f"Vacation days used: {vacation_used}")
-    
-        print(f"Querying sick days for database_id: {database_id}")
-        cursor.execute('''
-            SELECT COUNT(*) FROM time_records 
-            WHERE employee_id = ? AND date >= ? AND record_type = 'sick'
-        ''', (database_id, start_of_year)) 
-        sick_used = cursor.fetchone()[0]
-        print(f"Sick days used: {sick_used}")
-        conn.close()
-    
-        vacation_remaining = max(0, (employee[8] if len(employee) > 8 else 20) - vacation_used)
-        sick_remaining = max(0, (employee[9] if len(employee) > 9 else 10) - sick_used)
-    
-        print(f"Vacation remaining: {vacation_remaining}, Sick remaining: {sick_remaining}")
-    
-        work_info = [
-            ("Hours/Week:", f"{employee[7]:.1f}" if len(employee) > 7 else "40.0"),
-            ("Vacation Days/Year:", str(employee[8]) if len(employee) > 8 else "20"),
-            ("Sick Days/Year:", str(employee[9]) if len(employee) > 9 else "10"),
-            ("Vacation Days Remaining:", f"{vacation_remaining}"),
-            ("Sick Days Remaining:", f"{sick_remaining}")
-        ]
-    
-        for row, (label, value) in enumerate(work_info):
-            ttk.Label(work_frame, text=label).grid(row=row, column=0, sticky='w', padx=5, pady=5)
-            ttk.Label(work_frame, text=value, foreground='blue').grid(row=row, column=1, sticky='w', padx=5, pady=5)
-    
-        # Statistics Tab
-        stats_frame = ttk.Frame(details_notebook)
-        details_notebook.add(stats_frame, text="Statistics")
-    
-        current_month = datetime.now().month
-        
-        print("Calculating monthly and yearly summaries...")
-        monthly_summary = self.time_tracker.calculate_monthly_summary(database_id, current_year, current_month)
-        yearly_summary = self.time_tracker.calculate_yearly_summary(database_id, current_year)
-        
-        print(f"Monthly summary: {monthly_summary}")
-        print(f"Yearly summary: {yearly_summary}")
-    
-        stats_info = [
-            (f"{calendar.month_name[current_month]} {current_year}:", ""),
-            ("Work Hours:", f"{monthly_summary['total_work_hours']:.1f}"),
-            ("Overtime:", f"{monthly_summary['total_overtime']:.1f}"),
-            ("Vacation Days:", str(monthly_summary['vacation_days'])),
-            ("Sick Days:", str(monthly_summary['sick_days'])),
-            ("YTD Work Hours:", f"{yearly_summary['total_work_hours']:.1f}"),
-            ("YTD Overtime:", f"{yearly_summary['total_overtime']:.1f}")
-        ]
-    
-        for row, (label, value) in enumerate(stats_info):
-            ttk.Label(stats_frame, text=label).grid(row=row, column=0, sticky='w', padx=5, pady=5)
-            if value:  # Skip empty value for header row
-                ttk.Label(stats_frame, text=value, foreground='blue').grid(row=row, column=1, sticky='w', padx=5, pady=5)
-    
-        print("=== CREATE EMPLOYEE DETAILS WINDOW COMPLETED ===\n")
+
+        trees = []
+        for title, rows in zip(("Personal Info", "Work Details", "Statistics"), sections):
+            frame = ttk.Frame(details_notebook)
+            details_notebook.add(frame, text=title)
+            trees.append(self._build_property_grid(frame, [key for key, _, _ in rows]))
+        trees[2].insert('', 0, iid='Current Month')
+        trees[2].configure(height=len(trees[2].get_children()))
+
+        self._details_window = details_window
+        self._details_window_header = header_label
+        self._details_window_trees = trees
+        return details_window, header_label, trees
 
     def update_details_combo(self):
-        """Update the employee combobox in details tab"""
-        employees = self.employee_manager.get_all_employees(include_inactive=True)
-        emp_names = [f"{emp[1]} ({emp[2]})" for emp in employees]
-        self.details_emp_combo['values'] = emp_names
-        if emp_names:
-            self.details_emp_combo.current(0)
+        """Update the employee combobox in details tab (values are filled when the dropdown opens)"""
+        self._details_combo_filled = False
+        emp_names = self._emp_display_all
+        if emp_names and self.details_emp_var.get() not in emp_names:
+            self.details_emp_var.set(emp_names[0])
             self.load_employee_details()
 
+    def _lazy_fill_details_combo(self):
+        """Fill the details employee combobox right before its list is shown"""
+        if not self._details_combo_filled:
+            self._set_combo_values(self.details_emp_combo, self._emp_display_all)
+            self._details_combo_filled = True
+
+    def _schedule_details_load(self, event=None):
+        """Load details once the selection has settled, so arrowing through the list loads only the last employee"""
+        if self._details_load_job is not None:
+            self.root.after_cancel(self._details_load_job)
+        self._details_load_job = self.root.after(self._details_load_delay_ms, self._run_details_load)
+
+    def _run_details_load(self):
+        """Run the debounced details load"""
+        self._details_load_job = None
+        self.load_employee_details()
+
     def load_employee_details(self, event=None):
         """Load details for the selected employee"""
-        print("=== LOAD EMPLOYEE DETAILS STARTED ===")
-
         selected = self.details_emp_var.get()
-        print(f"Selected from details combobox: '{selected}'")
+        log.debug("Selected from details combobox: %r", selected)
 
         if not selected:
-            print("No employee selected in details combobox")
+            log.debug("No employee selected in details combobox")
             return
 
         # Extract employee info from combobox selection (format: "Name (employee_id)")
         # e.g., "Mario Musterjunge (0001)" -> extract "0001"
-        if '(' in selected and ')' in selected:
-            try:
-                # Extract the employee_id part between parentheses
-                employee_id_str = selected.split('(')[1].split(')')[0].strip()
-                print(f"Extracted employee_id: '{employee_id_str}'")
-            except (IndexError, ValueError) as e:
-                print(f"ERROR parsing employee selection '{selected}': {e}")
-                messagebox.showerror("Error", f"Invalid employee selection format: {selected}")
-                return
-        else:
-            print(f"ERROR: Invalid selection format '{selected}'")
+        employee_id_str = _parse_emp_id(selected)
+        if employee_id_str is None:
+            log.warning("Invalid selection format %r", selected)
             messagebox.showerror("Error", f"Invalid employee selection format: {selected}")
             return
+        log.debug("Extracted employee_id: %r", employee_id_str)
 
-        # Find employee in database using employee_id
-        print(f"Looking up employee with employee_id: '{employee_id_str}'")
-        employees = self.employee_manager.get_all_employees(include_inactive=True)
-        employee = None
-
-        for emp in employees:
-            print(f"  Checking employee: DB_ID={emp[0]}, employee_id='{emp[2]}', name='{emp[1]}'")
-            if emp[2] == employee_id_str:  # emp[2] is employee_id
-                employee = emp
-                print(f"  FOUND MATCH: {emp}")
-                break
+        # Employee row and period totals come from the prefetched details bundle
+        bundle = self._get_details_bundle()
+        details = bundle.get(employee_id_str)
 
-        if not employee:
-            print(f"ERROR: Employee with employee_id '{employee_id_str}' not found")
+        if not details:
+            log.warning("Employee with employee_id %r not found", employee_id_str)
             messagebox.showerror("Error", f"Employee {employee_id_str} not found in database")
             return
 
-        print(f"Employee found: {employee}")
-        database_id = employee[0]  # Get the database ID for queries
-        print(f"Using database_id {database_id} for database queries")
-
-        # Update personal info
-        print("Updating personal info display...")
-        self.personal_info_values['Name'].config(text=employee[1])
-        self.personal_info_values['Employee ID'].config(text=employee[2])
-        self.personal_info_values['Position'].config(text=employee[3] if employee[3] else "N/A")
-        self.personal_info_values['Hourly Rate'].config(text=f"€{employee[4]:.2f}" if employee[4] else "N/A")
-        self.personal_info_values['Email'].config(text=employee[5] if employee[5] else "N/A")
-        self.personal_info_values['Hire Date'].config(text=employee[6] if employee[6] else "N/A")
-        self.personal_info_values['Status'].config(
-            text="Active" if employee[10] else "Inactive",
-            foreground="green" if employee[10] else "red"
-        )
-
-        # Update work info
-        print("Updating work info display...")
-        self.work_info_values['Hours/Week'].config(text=f"{employee[7]:.1f}" if employee[7] else "N/A")
-        self.work_info_values['Vacation Days/Year'].config(text=str(employee[8]) if employee[8] else "N/A")
-        self.work_info_values['Sick Days/Year'].config(text=str(employee[9]) if employee[9] else "N/A")
-
-        # Calculate and display remaining days
-        print("Calculating vacation/sick days...")
-        current_year = datetime.now().year
-        start_of_year = date(current_year, 1, 1)
-
-        conn = self.db_manager.get_connection()
-        cursor = conn.cursor()
-
-        # Get vacation days used this year use database_id (employee[0])
-        print(f"Querying vacation days for database_id: {database_id}")
-        cursor.execute('''
-            SELECT COUNT(*) FROM time_records 
-            WHERE employee_id = ? AND date >= ? AND record_type = 'vacation'
-        ''', (database_id, start_of_year))
-        vacation_used = cursor.fetchone()[0]
-        print(f"Vacation days used: {vacation_used}")
-
-        # Get sick days used this year use database_id 
-        print(f"Querying sick days for database_id: {database_id}")
-        cursor.execute('''
-            SELECT COUNT(*) FROM time_records 
-            WHERE employee_id = ? AND date >= ? AND record_type = 'sick'
-        ''', (database_id, start_of_year))
-        sick_used = cursor.fetchone()[0]
-        print(f"Sick days used: {sick_used}")
-        conn.close()
-
-        vacation_remaining = max(0, (employee[8] if employee[8] else 20) - vacation_used)
-        sick_remaining = max(0, (employee[9] if employee[9] else 10) - sick_used)
-
-        print(f"Vacation remaining: {vacation_remaining}, Sick remaining: {sick_remaining}")
-
-        self.work_info_values['Vacation Days Remaining'].config(
-            text=f"{vacation_remaining} (of {employee[8] if employee[8] else 20})",
-            foreground="green" if vacation_remaining > 0 else "red"
-        )
-        self.work_info_values['Sick Days Remaining'].config(
-            text=f"{sick_remaining} (of {employee[9] if employee[9] else 10})",
-            foreground="green" if sick_remaining > 0 else "red"
-        )
-
-        # Update statistics
-        print("Calculating statistics...")
-        current_month = datetime.now().month
-        monthly_summary = self.time_tracker.calculate_monthly_summary(database_id, current_year, current_month)
-        yearly_summary = self.time_tracker.calculate_yearly_summary(database_id, current_year)
-
-        print(f"Monthly summary: {monthly_summary}")
-        print(f"Yearly summary: {yearly_summary}")
+        personal, work, stats = self._employee_detail_rows(details['employee'], details['totals'])
+        self._fill_property_grid(self.personal_info_tree, personal)
+        self._fill_property_grid(self.work_info_tree, work)
+        self._fill_property_grid(self.stats_tree, stats)
+
+    @staticmethod
+    def _employee_detail_rows(employee, totals):
+        """(key, value, tag) rows for the personal, work and statistics sections of one employee"""
+        vacation_allowance = employee['vacation_days_per_year'] or 20
+        sick_allowance = employee['sick_days_per_year'] or 10
+        vacation_remaining = max(0, vacation_allowance - totals['ytd_vacation_days'])
+        sick_remaining = max(0, sick_allowance - totals['ytd_sick_days'])
+        log.debug("Vacation remaining: %s, Sick remaining: %s", vacation_remaining, sick_remaining)
+
+        personal = [
+            ('Name', employee['name'], None),
+            ('Employee ID', employee['employee_id'], None),
+            ('Position', employee['position'] or "N/A", None),
+            ('Hourly Rate', _fmt_money(employee['hourly_rate']) if employee['hourly_rate'] else "N/A", None),
+            ('Email', employee['email'] or "N/A", None),
+            ('Hire Date', employee['hire_date'] or "N/A", None),
+            ('Status', "Active" if employee['active'] else "Inactive", 'good' if employee['active'] else 'bad'),
+        ]
+        work = [
+            ('Hours/Week', _fmt_hours(employee['hours_per_week']) if employee['hours_per_week'] else "N/A", None),
+            ('Vacation Days/Year', str(employee['vacation_days_per_year'] or "N/A"), None),
+            ('Sick Days/Year', str(employee['sick_days_per_year'] or "N/A"), None),
+            ('Vacation Days Remaining', f"{vacation_remaining} (of {vacation_allowance})",
+             'good' if vacation_remaining > 0 else 'bad'),
+            ('Sick Days Remaining', f"{sick_remaining} (of {sick_allowance})",
+             'good' if sick_remaining > 0 else 'bad'),
+        ]
+        stats = [
+            ('Work Hours', f"{totals['month_work_hours']:.1f}", None),
+            ('Overtime', f"{totals['month_overtime']:.1f}", None),
+            ('Vacation Days', str(totals['month_vacation_days']), None),
+            ('Sick Days', str(totals['month_sick_days']), None),
+            ('YTD Work Hours', f"{totals['ytd_work_hours']:.1f}", None),
+            ('YTD Overtime', f"{totals['ytd_overtime']:.1f}", None),
+        ]
+        return personal, work, stats
 
-        self.stats_values['Work Hours'].config(text=f"{monthly_summary['total_work_hours']:.1f}")
-        self.stats_values['Overtime'].config(text=f"{monthly_summary['total_overtime']:.1f}")
-        self.stats_values['Vacation Days'].config(text=str(monthly_summary['vacation_days']))
-        self.stats_values['Sick Days'].config(text=str(monthly_summary['sick_days']))
-        self.stats_values['YTD Work Hours'].config(text=f"{yearly_summary['total_work_hours']:.1f}")
-        self.stats_values['YTD Overtime'].config(text=f"{yearly_summary['total_overtime']:.1f}")
+    def _fill_property_grid(self, tree, rows):
+        """Write (key, value, tag) rows into a property grid built by _build_property_grid"""
+        for key, value, tag in rows:
+            self._set_property(tree, key, value, tag)
 
-        print("=== LOAD EMPLOYEE DETAILS COMPLETED ===\n")
+    def _get_details_bundle(self):
+        """Employee rows and current month/year totals keyed by employee_id, built with one query per refresh"""
+        today = date.today()
+        period = (today.year, today.month)
+        if self._details_bundle is None or self._details_bundle_period != period:
+            employees = self.employee_manager.get_all_employees(include_inactive=True)
+            totals = self.time_tracker.get_employee_period_totals(*period)
+            self._details_bundle = {
+                emp['employee_id']: {'employee': emp, 'totals': totals[emp['id']]}
+                for emp in employees
+            }
+            self._details_bundle_period = period
+        return self._details_bundle
 
  # =============================================================================
  # TIME TRACKING METHODS
@@ -1836,169 +1860,92 @@ class EmployeeTimeApp:
             self.selected_employee_id = None
             return
 
-        print(f"Employee selected: '{selected}'")  # Debug print
+        log.debug("Employee selected: %r", selected)
 
         # Extract employee ID from selection (format: "Name (ID)")
-        if '(' in selected and ')' in selected:
-            try:
-                # Extract the ID part between parentheses
-                emp_id_str = selected.split('(')[1].split(')')[0].strip()
-                print(f"Extracted employee ID string: '{emp_id_str}'")  # Debug print
-
-                # Get employee database ID by looking up the employee_id in database
-                conn = self.db_manager.get_connection()
-                cursor = conn.cursor()
-                cursor.execute("SELECT id FROM employees WHERE employee_id = ?", (emp_id_str,))
-                result = cursor.fetchone()
-                conn.close()
-
-                if result:
-                    self.selected_employee = result[0]  # Database ID
-                    self.selected_employee_id = emp_id_str  # Display ID
-                    print(f"Selected employee DB ID: {self.selected_employee}")  # Debug print
-
-                    # Load time records for this employee
-                    self.load_time_records_data()
-                else:
-                    print(f"Employee with ID {emp_id_str} not found in database")
-                    self.selected_employee = None
-                    self.selected_employee_id = None
-
-            except (IndexError, ValueError) as e:
-                print(f"Error parsing employee selection: {e}")
-                self.selected_employee = None
-                self.selected_employee_id = None
+        emp_id_str = _parse_emp_id(selected)
+        if emp_id_str is None:
+            log.warning("Invalid employee selection format")
+            self.selected_employee = None
+            self.selected_employee_id = None
+            return
+        log.debug("Extracted employee ID string: %r", emp_id_str)
+
+        # Get employee database ID from the employee cache
+        database_id = self._empid_to_dbid.get(emp_id_str)
+
+        if database_id is not None:
+            self.selected_employee = database_id  # Database ID
+            self.selected_employee_id = emp_id_str  # Display ID
+            log.debug("Selected employee DB ID: %s", self.selected_employee)
+
+            # Load time records for this employee
+            self.load_time_records_data()
         else:
-            print("Invalid employee selection format")
+            log.warning("Employee with ID %s not found in database", emp_id_str)
             self.selected_employee = None
             self.selected_employee_id = None
 
     def load_time_records_data(self):
         """Load time records data from database and populate the treeview"""
-        print("=== load_time_records_data STARTED ===")
-
         # Check if we have a selected employee
         if not self.selected_employee:
-            print("ERROR: No employee selected!")
-            return
-
-        # Get employee name for display
-        conn = self.db_manager.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT name FROM employees WHERE id = ?", (self.selected_employee,))
-        emp_result = cursor.fetchone()
-
-        if not emp_result:
-            print(f"ERROR: Employee with ID {self.selected_employee} not found!")
-            conn.close()
+            log.warning("No employee selected!")
             return
 
-        emp_name = emp_result[0]
-        print(f"Loading records for employee: {emp_name} (ID: {self.selected_employee})")
-
-        # Clear existing data
-        current_items = self.time_tree.get_children()
-        print(f"Clearing {len(current_items)} existing items from tree")
-        for item in current_items:
-            self.time_tree.delete(item)
-
         try:
-            # Check date manager values
-            print(f"Date manager - Year: {self.date_manager.view_year}, Month: {self.date_manager.view_month}")
-
-            # Get time records for the selected month/year using the database ID
-            query_params = (self.selected_employee, str(self.date_manager.view_year), f"{self.date_manager.view_month:02d}")
-            print(f"Query parameters: {query_params}")
-
-            cursor.execute("""
-                SELECT date, 
-                       start_time_1, end_time_1,
-                       start_time_2, end_time_2, 
-                       start_time_3, end_time_3,
-                       total_time_present, hours_worked, total_break_time, 
-                       overtime_hours, record_type, notes,
-                       break_compliance, max_working_time_compliance,
-                       minimum_break_required, break_deficit
-                FROM time_records 
-                WHERE employee_id = ? 
-                AND strftime('%Y', date) = ? 
-                AND strftime('%m', date) = ?
-                ORDER BY date
-            """, query_params)
-
-            records = cursor.fetchall()
-            print(f"Found {len(records)} records in database")
-
-            for i, record in enumerate(records):
-                print(f"Processing record {i+1}: {record[0]}")  # Just print the date
-
-                (date, start1, end1, start2, end2, start3, end3, 
-                 total_present, worked, breaks, overtime, rec_type, notes,
-                 break_comp, work_time_comp, min_break_req, break_def) = record
-
-                # Format date
-                from datetime import datetime
-                date_obj = datetime.strptime(date, '%Y-%m-%d')
-                formatted_date = date_obj.strftime('%d.%m')
-
-                # Format time periods
-                time_periods = []
-                if start1 and end1:
-                    time_periods.append(f"{start1}-{end1}")
-                if start2 and end2:
-                    time_periods.append(f"{start2}-{end2}")
-                if start3 and end3:
-                    time_periods.append(f"{start3}-{end3}")
-
-                time_periods_str = ", ".join(time_periods) if time_periods else "—"
-
-                # Format hours (show as HH:MM)
-                def format_hours(hours):
-                    if hours is None or hours == 0:
-                        return "—"
-                    total_minutes = int(hours * 60)
-                    hrs = total_minutes // 60
-                    mins = total_minutes % 60
-                    return f"{hrs}:{mins:02d}"
-
-                # Format compliance status
-                compliance_issues = []
-                if not break_comp and break_def and break_def > 0:
-                    deficit_mins = int(break_def * 60)
-                    compliance_issues.append(f"Break -{deficit_mins}min")
-                if not work_time_comp:
-                    compliance_issues.append("Work time")
-
-                compliance_str = ", ".join(compliance_issues) if compliance_issues else "✓ OK"
-
-                # Add row to treeview
-                values_to_insert = (
-                    formatted_date,        # Date
-                    time_periods_str,      # Time Periods  
-                    format_hours(total_present),  # Present
-                    format_hours(worked),         # Worked
-                    format_hours(breaks),         # Breaks
-                    format_hours(overtime),       # Overtime
-                    rec_type.title() if rec_type else "Work",  # Type
-                    compliance_str,               # Compliance
-                    notes or "—"                  # Notes
-                )
-
-                print(f"Inserting into tree: {values_to_insert}")
-                self.time_tree.insert('', 'end', values=values_to_insert)
+            rows = self._month_records(self.selected_employee, self.date_manager.view_year, self.date_manager.view_month)
+            # Cached month rows are shared lists, so identity means the tree already shows them
+            if rows is self._shown_time_rows:
+                return
+            self._bulk_insert(self.time_tree, rows)
+            self._shown_time_rows = rows
 
-            print(f"Successfully inserted {len(records)} records into treeview")
+            log.debug("Successfully inserted %s records into treeview", len(rows))
 
         except Exception as e:
-            print(f"ERROR in load_time_records_data: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Failed to load time records")
             if hasattr(self, 'messagebox'):
                 messagebox.showerror("Error", f"Failed to load time records: {str(e)}")
-        finally:
-            conn.close()
 
-        print("=== load_time_records_data FINISHED ===")
+    def _month_records(self, emp_id, year, month):
+        """Return the treeview rows for one employee and month, served from cache when possible"""
+        key = (emp_id, year, month)
+        rows = self._month_records_cache.get(key)
+        if rows is not None:
+            return rows
+
+        # Half-open date range, so the (employee_id, date) index bounds the scan
+        next_month_start = f"{year + 1:04d}-01-01" if month == 12 else f"{year:04d}-{month + 1:02d}-01"
+        with self.db_manager.cursor() as cursor:
+            cursor.execute(_SQL_MONTH_ROWS, (emp_id, f"{year:04d}-{month:02d}-01", next_month_start))
+            rows = [tuple(row) for row in cursor]
+        log.debug("Found %s records in database", len(rows))
+
+        # Keep the cache bounded; dicts preserve insertion order so the oldest month goes first
+        if len(self._month_records_cache) >= 64:
+            del self._month_records_cache[next(iter(self._month_records_cache))]
+        self._month_records_cache[key] = rows
+        return rows
+
+    def _trim_month_records(self):
+        """Keep only the month currently shown in the time tracking tab"""
+        self._cache_release_job = None
+        key = (self.selected_employee, self.date_manager.view_year, self.date_manager.view_month)
+        rows = self._month_records_cache.get(key)
+        self._month_records_cache.clear()
+        if rows is not None:
+            self._month_records_cache[key] = rows
+
+    def _invalidate_month_records(self, emp_id=None):
+        """Drop cached month rows for one employee, or for everyone"""
+        self._details_bundle = None
+        self._months_cache = None
+        if emp_id is None:
+            self._month_records_cache.clear()
+            return
+        for key in [key for key in self._month_records_cache if key[0] == emp_id]:
+            del self._month_records_cache[key]
     
     def load_month_data(self):
         """Load time records for the selected month"""
@@ -2022,19 +1969,36 @@ class EmployeeTimeApp:
             self.update_preview_text("Non-work entries don't require time calculation.")
             return
 
-        # Get time entries
-        start_times = [var.get().strip() for var in self.start_time_vars if var.get().strip()]
-        end_times = [var.get().strip() for var in self.end_time_vars if var.get().strip()]
-
-        if not start_times or not end_times or len(start_times) != len(end_times):
+        periods = self._parse_periods_to_array()
+        if periods is None:
+            self.update_preview_text("Invalid time format. Please use HH:MM, e.g. 09:00.")
+            return
+        if not periods:
             self.update_preview_text("Please enter matching start and end times.")
             return
 
-        try:
-            # Use the time tracker's calculation method
-            calculated = self.time_tracker.calculate_time_entry(start_times, end_times)
+        # Use the time tracker's calculation on the minute pairs
+        calculated = self.time_tracker.calculate_periods(periods)
+        self.update_preview_text(self._format_time_preview(calculated))
 
-            preview_text = f"""Time Calculation Preview:
+    def _parse_periods_to_array(self):
+        """Return the entered periods as (start, end) minute pairs; [] if a row is incomplete, None if a time is invalid"""
+        periods = []
+        for start_entry, end_entry in zip(self.start_entries, self.end_entries):
+            start, end = start_entry.get().strip(), end_entry.get().strip()
+            if not start and not end:
+                continue
+            if not start or not end:
+                return []
+            start_min, end_min = parse_hhmm(start), parse_hhmm(end)
+            if start_min is None or end_min is None:
+                return None
+            periods.append((start_min, end_min))
+        return periods
+
+    def _format_time_preview(self, calculated):
+        """Format calculated time values for the preview box"""
+        return f"""Time Calculation Preview:
      • Total Time Present: {calculated['total_time_present']:.2f} hours
      • Work Time: {calculated['hours_worked']:.2f} hours  
      • Break Time: {calculated['total_break_time']:.2f} hours
@@ -2043,16 +2007,10 @@ class EmployeeTimeApp:
      • Break Compliance: {'✓' if calculated['break_compliance'] else '✗ Insufficient break'}
      • Working Time Compliance: {'✓' if calculated['max_working_time_compliance'] else '✗ Exceeds 10h limit'}"""
 
-            self.update_preview_text(preview_text)
-
-        except Exception as e:
-            self.update_preview_text(f"Error in calculation: {str(e)}")
-
     def update_preview_text(self, text):
         """Update the preview text widget"""
         self.preview_text.config(state=tk.NORMAL)
-        self.preview_text.delete(1.0, tk.END)
-        self.preview_text.insert(1.0, text)
+        self.preview_text.replace(1.0, tk.END, text)
         self.preview_text.config(state=tk.DISABLED)
 
     def add_time_entry(self):
@@ -2063,29 +2021,23 @@ class EmployeeTimeApp:
 
         try:
             # Get date components from form fields
-            print("Selecting the date:")
-            day = self.day_var.get()
-            month = self.date_month_var.get()
-            year = self.date_year_var.get()
+            day_text, month_text, year_text = self.day_spin.get(), self.month_spin.get(), self.year_spin.get()
+            if not (_is_int(day_text) and _is_int(month_text) and _is_int(year_text)):
+                messagebox.showerror("Error", "Please enter a valid date.")
+                return
+            day, month, year = int(day_text), int(month_text), int(year_text)
             # Create date string in YYYY-MM-DD format
             entry_date = f"{year:04d}-{month:02d}-{day:02d}"
 
-            self.start_times = [var.get().strip() for var in self.start_time_vars if var.get().strip()]
-            self.end_times = [var.get().strip() for var in self.end_time_vars if var.get().strip()]
-
-            print(f"day:\t\t{day}")
-            print(f"month:\t\t{month}")
-            print(f"year:\t\t{year}")
-            print(f"entry_date:\t{entry_date}")
+            self.start_times = [text for text in (entry.get().strip() for entry in self.start_entries) if text]
+            self.end_times = [text for text in (entry.get().strip() for entry in self.end_entries) if text]
 
             # Get time entry data
-            hours = self.hours_var.get()
             record_type = self.type_var.get()
             notes = self.notes_var.get()
 
-            print(f"hours\t\t{hours}")
-            print(f"record_type\t\t{record_type}")
-            print(f"notes\t\t{notes}")
+            log.debug("Adding %s entry for %s (day=%s month=%s year=%s), notes=%r",
+                      record_type, entry_date, day, month, year, notes)
 
             # Use the database ID (self.selected_employee) directly
             success, message = self.time_tracker.add_time_record(
@@ -2098,14 +2050,14 @@ class EmployeeTimeApp:
             )
 
             if success:
+                self._invalidate_month_records(self.selected_employee)
                 messagebox.showinfo("Success", message)
                 self.load_time_records_data() 
                 self.hours_var.set(0.0)
                 self.notes_var.set("")
                 self.clear_time_form()
             else:
-                print("Error!")
-                print(message)
+                log.warning("Adding time entry failed: %s", message)
                 messagebox.showerror("Error", message)
 
         except ValueError as e:
@@ -2115,8 +2067,8 @@ class EmployeeTimeApp:
 
     def clear_time_form(self):
         """Clear all time entry form fields"""
-        for var in self.start_time_vars + self.end_time_vars:
-            var.set("")
+        for entry in self.start_entries + self.end_entries:
+            entry.delete(0, tk.END)
         self.notes_var.set("")
         self.type_var.set("work")
         self.update_preview_text("Enter time periods above and click 'Calculate Preview' to see calculations.")
@@ -2130,7 +2082,7 @@ class EmployeeTimeApp:
 
         # Get record data
         item = self.time_tree.item(selection[0])
-        record_date = item['values'][0]
+        record_date = self._record_date(item['values'][0])
 
         employee_id = self.get_selected_employee_id()
         if not employee_id:
@@ -2150,17 +2102,16 @@ class EmployeeTimeApp:
         # Clear form first
         self.clear_time_form()
 
-        # Set date
-        date_parts = record_date.split('-')
-        self.date_year_var.set(int(date_parts[0]))
-        self.date_month_var.set(int(date_parts[1]))
-        self.day_var.set(int(date_parts[2]))
+        # Set date (YYYY-MM-DD)
+        self.date_year_var.set(int(record_date[0:4]))
+        self.date_month_var.set(int(record_date[5:7]))
+        self.day_var.set(int(record_date[8:10]))
 
         # Set times
         for i, (start, end) in enumerate(zip(start_times, end_times)):
             if i < 3:  # Max 3 periods
-                self.start_time_vars[i].set(start)
-                self.end_time_vars[i].set(end)
+                self.start_entries[i].insert(0, start)
+                self.end_entries[i].insert(0, end)
 
         # Set other fields
         self.type_var.set(details['record_type'])
@@ -2185,7 +2136,7 @@ class EmployeeTimeApp:
             if not item_values or len(item_values) < 1:
                 raise ValueError("Invalid record selected")
 
-            record_date = item_values[0]  # First column is date
+            record_date = self._record_date(item_values[0])
             employee_id = self.selected_employee
 
             # Confirm deletion
@@ -2196,31 +2147,12 @@ class EmployeeTimeApp:
             if not confirm:
                 return
 
-            conn = self.db_manager.get_connection()
-            cursor = conn.cursor()
-
-            cursor.execute('''
-                SELECT COUNT(*) FROM time_records 
-                WHERE employee_id = ? AND date = ?
-            ''', (employee_id, record_date))
-
-            count = cursor.fetchone()[0]
-
-            if count == 0:
+            # One statement; the row count tells whether duplicates for this date were removed too
+            deleted_rows = self.db_manager.execute_write(_SQL_DELETE_DAY_RECORDS, (employee_id, record_date))
+            if deleted_rows == 0:
                 raise ValueError("No matching record found in database")
-            elif count > 1:
-                # Handle case where duplicates exist
-                messagebox.showwarning("Warning", 
-                                     f"Found {count} entries for this date. Deleting all matching entries.")
 
-            # Proceed with deletion
-            cursor.execute('''
-                DELETE FROM time_records 
-                WHERE employee_id = ? AND date = ?
-            ''', (employee_id, record_date))
-
-            deleted_rows = cursor.rowcount
-            conn.commit()
+            self._invalidate_month_records(employee_id)
 
             if deleted_rows == 1:
                 messagebox.showinfo("Success", "Time entry deleted successfully")
@@ -2232,9 +2164,12 @@ class EmployeeTimeApp:
 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to delete time entry: {str(e)}")
-        finally:
-            if 'conn' in locals():
-                conn.close()
+
+    def _record_date(self, displayed_date):
+        """Database date (YYYY-MM-DD) for a DD.MM date shown in the time records tree"""
+        # Tk may hand the value back as a number (e.g. 2.04), so split rather than slice
+        day = str(displayed_date).split('.')[0].zfill(2)
+        return f"{self.date_manager.view_year}-{self.date_manager.view_month:02d}-{day}"
 
     def view_time_details(self):
         """Show detailed view of selected time record"""
@@ -2251,110 +2186,76 @@ class EmployeeTimeApp:
         if not values:
             return
 
-        # Create detail window
-        detail_window = tk.Toplevel(self.root)
-        detail_window.title("Time Record Details")
-        detail_window.geometry("450x400")
-        detail_window.resizable(False, False)
-
         # Get full record from database for detailed view
         try:
-            conn = sqlite3.connect(self.db_name)
-            cursor = conn.cursor()
-
-            # Get employee ID
-            cursor.execute("SELECT id FROM employees WHERE name = ?", (self.emp_var.get(),))
-            emp_result = cursor.fetchone()
-            if not emp_result:
+            employee_id = self.selected_employee
+            if not employee_id:
                 return
 
-            employee_id = emp_result[0]
-
             # Convert displayed date back to database format
-            displayed_date = values[0]  # DD.MM format
-            full_date = f"{self.date_manager.view_year}-{self.date_manager.view_month:02d}-{displayed_date.split('.')[0].zfill(2)}"
+            full_date = self._record_date(values[0])
 
-            cursor.execute("""
-                SELECT * FROM time_records 
-                WHERE employee_id = ? AND date = ?
-            """, (employee_id, full_date))
-
-            record = cursor.fetchone()
-            conn.close()
+            record = self.db_manager.execute_one(_SQL_DAY_RECORD, (employee_id, full_date))
 
             if record:
-                # Display detailed information
-                details_text = tk.Text(detail_window, wrap=tk.WORD, padx=10, pady=10)
-                details_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-
                 # Format detailed information
-                detail_info = f"""Date: {full_date}
-        Employee: {self.emp_var.get()}
-
-        Time Periods:
-        """
-                if record[3] and record[4]:  # start_time_1, end_time_1
-                    detail_info += f"  Period 1: {record[3]} - {record[4]}\n"
-                if record[5] and record[6]:  # start_time_2, end_time_2
-                    detail_info += f"  Period 2: {record[5]} - {record[6]}\n"
-                if record[7] and record[8]:  # start_time_3, end_time_3
-                    detail_info += f"  Period 3: {record[7]} - {record[8]}\n"
-
-                detail_info += f"""
-        Time Summary:
-          Total Present: {record[12]:.2f} hours
-          Hours Worked: {record[13]:.2f} hours
-          Break Time: {record[9]:.2f} hours
-          Overtime: {record[14]:.2f} hours
-
-        German Labor Law Compliance:
-          Minimum Break Required: {record[10]:.2f} hours
-          Break Deficit: {record[11]:.2f} hours
-          Break Compliance: {'✓ OK' if record[17] else '✗ Non-compliant'}
-          Working Time Compliance: {'✓ OK' if record[18] else '✗ Non-compliant'}
-
-        Record Information:
-          Type: {record[15].title() if record[15] else 'Work'}
-          Notes: {record[16] if record[16] else 'None'}
-
-        Created: {record[19] if len(record) > 19 else 'N/A'}
-        Updated: {record[20] if len(record) > 20 else 'N/A'}
-        """
+                periods = "".join(
+                    f"  Period {n}: {record[f'start_time_{n}']} - {record[f'end_time_{n}']}\n"
+                    for n in (1, 2, 3) if record[f'start_time_{n}'] and record[f'end_time_{n}']
+                )
+                detail_info = _TIME_DETAIL_TEMPLATE.format_map({
+                    **dict(record),
+                    'date': full_date,
+                    'employee': self.emp_var.get(),
+                    'periods': periods,
+                    'break_status': '✓ OK' if record['break_compliance'] else '✗ Non-compliant',
+                    'time_status': '✓ OK' if record['max_working_time_compliance'] else '✗ Non-compliant',
+                    'type': record['record_type'].title() if record['record_type'] else 'Work',
+                    'notes': record['notes'] or 'None',
+                    'created_at': record['created_at'] or 'N/A',
+                    'updated_at': record['updated_at'] or 'N/A',
+                })
 
-                details_text.insert('1.0', detail_info)
+                # Display detailed information
+                detail_window, details_text = self._get_record_detail_window()
+                details_text.config(state=tk.NORMAL)
+                details_text.replace('1.0', tk.END, detail_info)
                 details_text.config(state=tk.DISABLED)
+                detail_window.deiconify()
+                detail_window.lift()
 
         except Exception as e:
             if hasattr(self, 'messagebox'):
                 self.messagebox.showerror("Error", f"Failed to load record details: {str(e)}")
-            detail_window.destroy()
+
+    def _get_record_detail_window(self):
+        """Time record detail window and its text widget; built once, hidden instead of destroyed on close"""
+        if self._record_detail_window is not None and self._record_detail_window.winfo_exists():
+            return self._record_detail_window, self._record_detail_text
+
+        detail_window = tk.Toplevel(self.root)
+        detail_window.title("Time Record Details")
+        detail_window.geometry("450x400")
+        detail_window.resizable(False, False)
+        detail_window.protocol("WM_DELETE_WINDOW", detail_window.withdraw)
+
+        details_text = tk.Text(detail_window, wrap=tk.WORD, padx=10, pady=10)
+        details_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        self._record_detail_window = detail_window
+        self._record_detail_text = details_text
+        return detail_window, details_text
 
     def get_selected_employee_id(self):
         """Get the ID of the currently selected employee - Fixed version"""
         if not self.emp_var.get():
             return None
 
-        # Extract employee ID from the combo selection (format: "Name (ID)")
-        emp_text = self.emp_var.get()
-        if '(' in emp_text and ')' in emp_text:
-            try:
-                emp_id_str = emp_text.split('(')[1].split(')')[0].strip()
-
-                # Look up the database ID
-                conn = self.db_manager.get_connection()
-                cursor = conn.cursor()
-                cursor.execute("SELECT id FROM employees WHERE employee_id = ?", (emp_id_str,))
-                result = cursor.fetchone()
-                conn.close()
-
-                if result:
-                    return result[0]  # Return database ID
-                else:
-                    return None
-
-            except (IndexError, ValueError):
-                return None
-        return None
+        # Extract employee ID from the combo selection (format: "Name (ID)") and look up the database ID
+        emp_id_str = _parse_emp_id(self.emp_var.get())
+        if emp_id_str is None:
+            return None
+        return self._empid_to_dbid.get(emp_id_str)
 
  # =============================================================================
  # REPORT GENERATION METHODS
@@ -2368,19 +2269,16 @@ class EmployeeTimeApp:
             return
 
         try:
-            # Use ReportManager instead of employee_manager
-            employees = self.report_manager.get_available_employees()
-            employee_names = [f"{emp['name']} (ID: {emp['employee_id']})" for emp in employees]
-
-            self.report_emp_combo['values'] = employee_names
-            self.employees_data = employees
+            # Same display list as the time tracking combo; indices match self.employees_data
+            employee_names = self._emp_display
+            self._set_combo_values(self.report_emp_combo, employee_names)
 
-            if employee_names:
-                self.report_emp_combo.current(0)
-                self.on_report_employee_selected(None)
-            else:
+            if not employee_names:
                 self.report_text.delete(1.0, tk.END)
                 self.report_text.insert(tk.END, "No employees found in database.\n")
+            elif self.report_emp_combo.current() < 0:
+                self.report_emp_combo.current(0)
+                self.on_report_employee_selected(None)
 
         except Exception as e:
             self.report_text.delete(1.0, tk.END)
@@ -2401,7 +2299,7 @@ class EmployeeTimeApp:
             if selected_index >= 0 and selected_index < len(self.employees_data):
                 employee = self.employees_data[selected_index]
 
-                months = self.report_manager.get_available_months_for_employee(employee['id'])
+                months = self._available_months().get(employee['id'], [])
 
                 if months:
                     latest_month = months[0]
@@ -2414,7 +2312,7 @@ class EmployeeTimeApp:
                     self.report_text.insert(tk.END, "Available months with data:\n")
                     for month_info in months:
                         self.report_text.insert(tk.END, f"  • {month_info['display_name']} ({month_info['record_count']} records)\n")
-                    self.report_text.insert(tk.END, f"\nCurrent selection: {calendar.month_name[latest_month['month']]} {latest_month['year']}\n\n")
+                    self.report_text.insert(tk.END, f"\nCurrent selection: {_MONTH_NAMES[latest_month['month']]} {latest_month['year']}\n\n")
                     self.report_text.insert(tk.END, "Click 'Generate Preview' to see report details\n")
                     self.report_text.insert(tk.END, "Click 'Export PDF' to create PDF file")
                 else:
@@ -2427,6 +2325,13 @@ class EmployeeTimeApp:
             self.report_text.delete(1.0, tk.END)
             self.report_text.insert(tk.END, f"Error loading employee data: {e}")
 
+    def _available_months(self):
+        """Months with records per employee database id, read for all employees at once and cached"""
+        if self._months_cache is None:
+            ids = [emp['id'] for emp in self.employees_data]
+            self._months_cache = self.report_manager.get_available_months_for_employees(ids)
+        return self._months_cache
+
     def generate_report_preview(self):
         """Generate a report preview in the text area"""
         if not self.report_manager:
@@ -2457,8 +2362,10 @@ class EmployeeTimeApp:
                 return
 
             employee = self.employees_data[selected_index]
-            year = self.report_year_var.get()
-            month = self.report_month_var.get()
+            period = self._read_report_period()
+            if period is None:
+                return
+            year, month = period
 
             # Start progress indication
             self.report_generation_active = True
@@ -2466,11 +2373,8 @@ class EmployeeTimeApp:
             self.progress_bar.start()
             self.generate_btn.config(state='disabled')
 
-            # Run in thread to avoid blocking UI
-            import threading
-            thread = threading.Thread(target=self._generate_report_worker, args=(employee['id'], year, month))
-            thread.daemon = True
-            thread.start()
+            # Run on the report worker to avoid blocking UI
+            self._report_pool.submit(self._generate_report_worker, employee['id'], year, month)
 
         except Exception as e:
             self.report_generation_active = False
@@ -2478,71 +2382,41 @@ class EmployeeTimeApp:
             self.generate_btn.config(state='normal')
             messagebox.showerror("Error", f"Failed to start report generation: {e}")    
     
+    def _read_report_period(self):
+        """Return (year, month) from the report spinboxes, or None after reporting invalid input"""
+        year_text = self.year_spinbox.get().strip()
+        month_text = self.month_spinbox.get().strip()
+        if not (_is_int(year_text) and _is_int(month_text) and 1 <= int(month_text) <= 12):
+            messagebox.showerror("Error", "Please enter a valid month (1-12) and year.")
+            return None
+        return int(year_text), int(month_text)
+
     def _generate_report_worker(self, employee_id, year, month):
-        """Worker thread for report generation"""
+        """Report preview job, runs on the report worker"""
         try:
-            employee_info = self.report_manager.get_employee_info(employee_id)
-            time_records = self.report_manager.get_time_records(employee_id, year, month)
-            summary = self.report_manager.calculate_summary(time_records)
-            company_info = self.report_manager.get_company_info()
-
-            month_name = calendar.month_name[month]
-
-            # Create detailed report preview
-            report_content = f"""
-        MONTHLY TIME REPORT PREVIEW
-        {'=' * 50}
-
-        Company: {company_info['company_name']}
-        Address: {company_info['company_street']}, {company_info['company_city']}
-        Phone: {company_info['company_phone']}
-        Email: {company_info['company_email']}
-
-        Employee Information:
-          Name: {employee_info['name']}
-          Employee ID: {employee_info['employee_number']}
-          Report Period: {month_name} {year}
-
-        SUMMARY:
-          Total Working Hours: {summary['total_hours']:.2f} hours
-          Vacation Days Used: {summary['vacation_days']} day(s)
-          Sick Leave Taken: {summary['sick_days']} day(s)
-          Total Break Time: {summary['total_break_minutes']} minutes
-
-        DETAILED TIME RECORDS:
-        {'─' * 80}
-        {'Date':<12} {'Start':<8} {'End':<8} {'Hours':<8} {'Break':<8} {'Vacation':<10} {'Sick':<6}
-        {'─' * 80}
-        """
-
-            for record in time_records:
-                vacation = "Yes" if record['is_vacation'] else "No"
-                sick = "Yes" if record['is_sick'] else "No"
-                hours = f"{record['hours_worked']:.1f}h" if record['hours_worked'] > 0 else "-"
-                break_time = f"{record['break_minutes']}min" if record['break_minutes'] > 0 else "-"
-
-                report_content += f"\t\t{record['date']:<12} {record['start_time']:<8} {record['end_time']:<8} {hours:<8} {break_time:<8} {vacation:<10} {sick:<6}\n"
-
-            report_content += f"\n\t{'─' * 80}\n"
-            report_content += f"\tTotal: {summary['total_hours']:.2f} hours worked this month\n"
-
-            if summary['vacation_days'] > 0 or summary['sick_days'] > 0:
-                report_content += f"\n\t\tTime Off Summary:\n"
-                if summary['vacation_days'] > 0:
-                    report_content += f"\t\t  • Vacation days: {summary['vacation_days']}\n"
-                if summary['sick_days'] > 0:
-                    report_content += f"\t\t  • Sick days: {summary['sick_days']}\n"
-
-            report_content += f"\n\t📄 To generate PDF: Click 'Export PDF' button\n"
-            report_content += f"\t📊 Report generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            if self._report_python:
+                report_content = self._run_external_report_worker(employee_id, year, month)
+            else:
+                report_content = build_report_preview(self.report_manager, employee_id, year, month)
 
             # Update UI on main thread
-            self.root.after(0, self._report_generation_completed, report_content, None)
+            self._post_to_ui(self._report_generation_completed, report_content, None)
 
         except Exception as e:
             # Update UI on main thread with error
-            self.root.after(0, self._report_generation_completed, None, str(e))
+            self._post_to_ui(self._report_generation_completed, None, str(e))
     
+    def _run_external_report_worker(self, employee_id, year, month):
+        """Build the report preview with report_worker.py under the configured interpreter (e.g. PyPy)"""
+        result = subprocess.run(
+            [self._report_python, _REPORT_WORKER_PATH, self.report_manager.db_path,
+             str(employee_id), str(year), str(month)],
+            capture_output=True, text=True, encoding='utf-8'
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Report worker failed ({self._report_python}):\n{result.stderr.strip()[-2000:]}")
+        return json.loads(result.stdout)['report']
+
     def _report_generation_completed(self, report_content, error):
         """Called when report generation completes"""
         self.report_generation_active = False
@@ -2551,13 +2425,11 @@ class EmployeeTimeApp:
         
         if error:
             self.progress_label.config(text="Error occurred")
-            self.report_text.delete(1.0, tk.END)
-            self.report_text.insert(tk.END, f"❌ Error generating report:\n\n{error}")
+            self.report_text.replace(1.0, tk.END, f"❌ Error generating report:\n\n{error}")
             messagebox.showerror("Generation Failed", f"Failed to generate report:\n\n{error}")
         else:
             self.progress_label.config(text="Report generated successfully")
-            self.report_text.delete(1.0, tk.END)
-            self.report_text.insert(tk.END, report_content)
+            self.report_text.replace(1.0, tk.END, report_content)
             self.export_btn.config(state='normal')  # Enable PDF export
     
     def export_pdf_report(self):
@@ -2590,18 +2462,19 @@ class EmployeeTimeApp:
                 return
 
             employee = self.employees_data[selected_index]
-            year = self.report_year_var.get()
-            month = self.report_month_var.get()
+            period = self._read_report_period()
+            if period is None:
+                return
+            year, month = period
 
             # Get default filename
             employee_name = employee['name'].replace(' ', '_').replace('/', '_')
-            month_name = calendar.month_name[month]
+            month_name = _MONTH_NAMES[month]
             default_filename = f"TimeReport_{employee_name}_{month_name}_{year}.pdf"
 
             default_dir = os.path.expanduser("~/Documents")  # Default to Documents folder
 
             # Ask user for save location
-            from tkinter import filedialog
             file_path = filedialog.asksaveasfilename(
                 title="Save PDF Report",
                 defaultextension=".pdf",
@@ -2618,22 +2491,26 @@ class EmployeeTimeApp:
                     else:
                         file_path = file_path + '.pdf'
 
-                # Start PDF generation
+                # Start PDF generation; both report buttons stay locked until
+                # _pdf_export_completed runs on the main thread
+                self.report_generation_active = True
                 self.progress_label.config(text="Generating PDF...")
-                self.progress_bar.start()
+                self.progress_bar.start(10)
+                self.generate_btn.config(state='disabled')
                 self.export_btn.config(state='disabled')
 
-                # Run in thread
-                thread = threading.Thread(target=self._export_pdf_worker, 
-                                        args=(employee['id'], year, month, file_path))
-                thread.daemon = True
-                thread.start()
+                # Run on the report worker
+                self._report_pool.submit(self._export_pdf_worker, employee['id'], year, month, file_path)
 
         except Exception as e:
+            self.report_generation_active = False
+            self.progress_bar.stop()
+            self.generate_btn.config(state='normal')
+            self.export_btn.config(state='normal')
             messagebox.showerror("Error", f"Failed to start PDF export: {e}")
 
     def _export_pdf_worker(self, employee_id, year, month, file_path):
-        """Worker thread for PDF export"""
+        """PDF export job, runs on the report worker"""
         try:
             pdf_path = self.report_manager.generate_pdf_report(
                 employee_id=employee_id,
@@ -2643,15 +2520,17 @@ class EmployeeTimeApp:
             )
 
             # Update UI on main thread
-            self.root.after(0, self._pdf_export_completed, pdf_path, None)
+            self._post_to_ui(self._pdf_export_completed, pdf_path, None)
 
         except Exception as e:
             # Update UI on main thread with error
-            self.root.after(0, self._pdf_export_completed, None, str(e))    
+            self._post_to_ui(self._pdf_export_completed, None, str(e))    
     
     def _pdf_export_completed(self, pdf_path, error):
         """Called when PDF export completes"""
+        self.report_generation_active = False
         self.progress_bar.stop()
+        self.generate_btn.config(state='normal')
         self.export_btn.config(state='normal')
         
         if error:
@@ -2664,9 +2543,6 @@ class EmployeeTimeApp:
             # Ask if user wants to open the PDF
             if messagebox.askyesno("Success", f"PDF exported successfully to:\n{pdf_path}\n\nWould you like to open it?"):
                 try:
-                    import subprocess
-                    import platform
-                    
                     if platform.system() == 'Windows':
                         os.startfile(pdf_path)
                     elif platform.system() == 'Darwin':  # macOS
@@ -2678,8 +2554,7 @@ class EmployeeTimeApp:
     
     def clear_report(self):
         """Clear the report display area"""
-        self.report_text.delete(1.0, tk.END)
-        self.report_text.insert(tk.END, "Report cleared. Select an employee and generate a new report.")
+        self.report_text.replace(1.0, tk.END, "Report cleared. Select an employee and generate a new report.")
         self.progress_label.config(text="Ready")
         self.last_pdf_path = None
 
@@ -2687,99 +2562,101 @@ class EmployeeTimeApp:
  # SETTINGS MANAGEMENT METHODS
  # =============================================================================
     
-    def pick_color(self, color_var, preview_label):
+    def pick_color(self, color_var, swatch_index):
         """Open color picker dialog"""
         try:
-            from tkinter import colorchooser
             current_color = color_var.get()
             color = colorchooser.askcolor(initialcolor=current_color, title="Choose Color")
             if color[1]:  # If user didn't cancel
-                color_var.set(color[1])
-                preview_label.config(bg=color[1])
+                color_var.set(color[1])  # trace redraws swatch_index
         except Exception as e:
             print(f"Color picker error: {e}")
 
-    def save_settings(self):
-        """Save all settings to database using SettingsManager"""
+    def update_color_swatch(self, index, color):
+        """Recolor one swatch on the color preview canvas"""
+        if color == self._swatch_colors[index]:
+            return
         try:
-            # Collect general settings from GUI
-            general_settings = {
-                'standard_hours_per_day': self.std_hours_var.get(),
-                'overtime_threshold': self.overtime_threshold_var.get(),
-                'vacation_days_per_year': self.default_vacation_var.get(),
-                'sick_days_per_year': self.default_sick_var.get(),
-                'business_days_per_week': 5 
-            }
+            self.color_canvas.itemconfig(self._color_rects[index], fill=color)
+            self._swatch_colors[index] = color
+        except tk.TclError:
+            pass  # Incomplete color while the user is still typing
 
-            # Collect company data from GUI
-            company_data = {
-                'companyname': self.company_name_var.get(),
-                'companystreet': self.company_street_var.get(),
-                'companycity': self.company_city_var.get(),
-                'companyphone': self.company_phone_var.get(),
-                'companyemail': self.company_email_var.get(),
-                'company_color_1': self.company_color1_var.get(),
-                'company_color_2': self.company_color2_var.get(),
-                'company_color_3': self.company_color3_var.get()
-            }
+    def _collect_report_settings(self, template_id=None):
+        """Report settings from the template tab, converted to the values stored in the database
 
-            # Collect report settings from GUI
-            report_settings = {}
+        template_id overrides the selected template, e.g. after falling back to 'default'.
+        """
+        has_template_vars = hasattr(self, 'template_display_var') and hasattr(self, 'template_mapping')
+        if template_id is None and has_template_vars:
+            template_id = self.template_mapping.get(self.template_display_var.get(), 'default')
 
-            # Language setting - convert from display name to code
-            if hasattr(self, 'language_var'):
-                language_display = self.language_var.get()
-                if language_display == 'Deutsch':
-                    report_settings['lang'] = 'de'
-                else:
-                    report_settings['lang'] = 'en'
-            else:
-                report_settings['lang'] = 'en'  # Default
-
-            # Template setting - convert from GUI template ID to DATABASE template ID
-            if hasattr(self, 'template_display_var') and hasattr(self, 'template_mapping'):
-                template_display = self.template_display_var.get()
-                # Get the GUI template ID
-                gui_template_id = self.template_mapping.get(template_display, 'default')
-
-                # Map GUI template IDs to DATABASE template IDs
-                gui_to_db_template_mapping = {
-                    'default': 'default',           # ReportLab -> default
-                    'latex_bw': 'black-white',      # LaTeX B&W -> black-white  
-                    'latex_color': 'color'          # LaTeX Color -> color
-                }
-
-                # Convert to database expected value
-                db_template_id = gui_to_db_template_mapping.get(gui_template_id, 'default')
-                report_settings['template'] = db_template_id
-
-                print(f"Template conversion: {template_display} -> {gui_template_id} -> {db_template_id}")
-            else:
-                report_settings['template'] = 'color'  # Default
+        if template_id is not None:
+            template = _ID_TO_DB_TEMPLATE.get(template_id, 'default')
+        else:
+            template = 'color'  # Default
 
-            # Output path setting
-            if hasattr(self, 'template_output_var'):
-                report_settings['default_output_path'] = self.template_output_var.get()
-            else:
-                report_settings['default_output_path'] = './reports/'  # Default
+        if hasattr(self, 'language_var'):
+            lang = _LANG_DISPLAY_TO_CODE.get(self.language_var.get(), 'en')
+        else:
+            lang = 'en'
 
-            print(f"Collected settings:")
-            print(f"  General: {general_settings}")
-            print(f"  Company: {company_data}")
-            print(f"  Report: {report_settings}")
+        if hasattr(self, 'template_output_var'):
+            output_path = self.template_output_var.get()
+        else:
+            output_path = './reports/'
+
+        return {'lang': lang, 'template': template, 'default_output_path': output_path}
+
+    def _collect_settings(self):
+        """General settings, company data and report settings as currently entered in the settings tab"""
+        # Collect general settings from GUI
+        general_settings = {
+            'standard_hours_per_day': self.std_hours_var.get(),
+            'overtime_threshold': self.overtime_threshold_var.get(),
+            'vacation_days_per_year': self.default_vacation_var.get(),
+            'sick_days_per_year': self.default_sick_var.get(),
+            'business_days_per_week': 5 
+        }
+
+        # Collect company data from GUI
+        company_data = {
+            'companyname': self.company_name_var.get(),
+            'companystreet': self.company_street_var.get(),
+            'companycity': self.company_city_var.get(),
+            'companyphone': self.company_phone_var.get(),
+            'companyemail': self.company_email_var.get(),
+            'company_color_1': self.company_color1_var.get(),
+            'company_color_2': self.company_color2_var.get(),
+            'company_color_3': self.company_color3_var.get()
+        }
+
+        return general_settings, company_data, self._collect_report_settings()
+
+    def save_settings(self):
+        """Save all settings to database using SettingsManager"""
+        try:
+            collected = self._collect_settings()
+            if collected == self._saved_settings:
+                messagebox.showinfo("Success", "No changes to save.")
+                return
+            general_settings, company_data, report_settings = collected
+
+            log.debug("Collected settings: general=%s company=%s report=%s",
+                      general_settings, company_data, report_settings)
 
             # Save all settings
-            if self.settings_manager.save_all_settings(general_settings, company_data, report_settings):
-                print("Settings saved successfully!")
+            saved = self.settings_manager.save_all_settings(general_settings, company_data, report_settings)
+            if self.report_manager:
+                self.report_manager.invalidate_company_info()
+            if saved:
+                self._saved_settings = collected
                 messagebox.showinfo("Success", "Settings saved successfully!")
             else:
-                print("Error saving settings!")
                 messagebox.showerror("Error", "Failed to save settings!")
 
         except Exception as e:
-            print(f"Error in save_settings: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Error in save_settings")
             messagebox.showerror("Error", f"Error saving settings: {e}")
 
     def load_settings(self):
@@ -2788,111 +2665,35 @@ class EmployeeTimeApp:
             # Load all settings
             all_settings = self.settings_manager.load_all_settings()
 
-            # Load general settings
-            general = all_settings.get('general', {})
-            if hasattr(self, 'std_hours_var'):
-                self.std_hours_var.set(general.get('standard_hours_per_day', 8.0))
-            if hasattr(self, 'overtime_threshold_var'):
-                self.overtime_threshold_var.set(general.get('overtime_threshold', 40.0))
-            if hasattr(self, 'default_vacation_var'):
-                self.default_vacation_var.set(general.get('vacation_days_per_year', 20))
-            if hasattr(self, 'default_sick_var'):
-                self.default_sick_var.set(general.get('sick_days_per_year', 10))
-
-            # Load company data
-            company = all_settings.get('company', {})
-            if hasattr(self, 'company_name_var'):
-                self.company_name_var.set(company.get('companyname', 'Meine Firma GmbH'))
-            if hasattr(self, 'company_street_var'):
-                self.company_street_var.set(company.get('companystreet', 'Geschäftsstraße 123'))
-            if hasattr(self, 'company_city_var'):
-                self.company_city_var.set(company.get('companycity', '10115 Berlin'))
-            if hasattr(self, 'company_phone_var'):
-                self.company_phone_var.set(company.get('companyphone', '+49-30-1234567'))
-            if hasattr(self, 'company_email_var'):
-                self.company_email_var.set(company.get('companyemail', 'contact@meinefirma.com'))
-
-            # Load and update company colors
-            if hasattr(self, 'company_color1_var'):
-                color1 = company.get('company_color_1', '#1E40AF')
-                self.company_color1_var.set(color1)
-                if hasattr(self, 'color1_preview'):
-                    try:
-                        self.color1_preview.config(bg=color1)
-                    except tk.TclError:
-                        pass
-
-            if hasattr(self, 'company_color2_var'):
-                color2 = company.get('company_color_2', '#3B82F6')
-                self.company_color2_var.set(color2)
-                if hasattr(self, 'color2_preview'):
-                    try:
-                        self.color2_preview.config(bg=color2)
-                    except tk.TclError:
-                        pass
-
-            if hasattr(self, 'company_color3_var'):
-                color3 = company.get('company_color_3', '#93C5FD')
-                self.company_color3_var.set(color3)
-                if hasattr(self, 'color3_preview'):
-                    try:
-                        self.color3_preview.config(bg=color3)
-                    except tk.TclError:
-                        pass
+            for section, key, var, default in self._settings_fields:
+                var.set(all_settings.get(section, {}).get(key, default))
 
             # Load report settings
             report = all_settings.get('report', {})
-
-            if hasattr(self, 'language_var'):
-                current_lang = report.get('lang', 'en')
-                if current_lang == 'de':
-                    self.language_var.set('Deutsch')
-                else:
-                    self.language_var.set('English')
+            current_lang = report.get('lang', 'en')
+            self.language_var.set(_LANG_CODE_TO_DISPLAY.get(current_lang, 'English'))
 
             # Set template
-            if hasattr(self, 'template_display_var') and hasattr(self, 'template_mapping'):
-                current_db_template = report.get('template', 'default')
-
-                # Map DATABASE template ID to GUI template ID
-                db_to_gui_template_mapping = {
-                    'default': 'default',           # default -> ReportLab
-                    'black-white': 'latex_bw',      # black-white -> LaTeX B&W  
-                    'color': 'latex_color'          # color -> LaTeX Color
-                }
-
-                # Convert database value to GUI template ID
-                gui_template_id = db_to_gui_template_mapping.get(current_db_template, 'default')
-
-                # Map GUI template ID to display name
-                gui_template_to_display = {
-                    'default': 'Default (ReportLab)',
-                    'latex_bw': 'LaTeX Black & White',
-                    'latex_color': 'LaTeX Color'
-                }
-
-                target_display = gui_template_to_display.get(gui_template_id, 'Default (ReportLab)')
-
-                print(f"Template loading conversion: {current_db_template} -> {gui_template_id} -> {target_display}")
-
-                for choice in self.template_mapping.keys():
-                    if choice.startswith(target_display):
-                        self.template_display_var.set(choice)
-                        print(f"Set template display to: {choice}")
-                        break
-                else:
-                    print(f"Warning: Could not find template choice starting with '{target_display}'")
+            current_db_template = report.get('template', 'default')
 
-            # Set output path using the correct variable name
-            if hasattr(self, 'template_output_var'):
-                self.template_output_var.set(report.get('default_output_path', './reports/'))
+            # Convert database value to GUI template ID
+            gui_template_id = _DB_TEMPLATE_TO_ID.get(current_db_template, 'default')
 
-            print("Settings loaded successfully!")
+            target_display = self.template_id_to_display.get(gui_template_id)
 
-        except Exception as e:
-            print(f"Error loading settings: {e}")
-            import traceback
-            traceback.print_exc()
+            log.debug("Template loading conversion: %s -> %s -> %s",
+                      current_db_template, gui_template_id, target_display)
+
+            if target_display:
+                self.template_display_var.set(target_display)
+            else:
+                log.warning("No template choice for '%s'", gui_template_id)
+
+            self._saved_settings = self._collect_settings()
+
+        except Exception:
+            self._saved_settings = None
+            log.exception("Error loading settings")
 
     def reset_settings(self):
         """Reset all settings to defaults using SettingsManager"""
@@ -2910,7 +2711,10 @@ class EmployeeTimeApp:
             return  # User cancelled, do nothing
 
         try:
-            if self.settings_manager.reset_to_defaults():
+            reset = self.settings_manager.reset_to_defaults()
+            if self.report_manager:
+                self.report_manager.invalidate_company_info()
+            if reset:
                 # After resetting in database, load the defaults into the GUI
                 self.load_settings()
                 print("Settings reset to defaults!")
@@ -2925,8 +2729,6 @@ class EmployeeTimeApp:
 
     def browse_database(self):
         """Open file dialog to select database location"""
-        from tkinter import filedialog
-
         # Open file dialog to select .db file
         file_path = filedialog.asksaveasfilename(
             title="Select Database File",
@@ -2947,20 +2749,16 @@ class EmployeeTimeApp:
 
         try:
             # Get language setting
-            language_display = self.language_var.get()
-            if language_display == 'Deutsch':
-                language_code = 'de'
-            else:
-                language_code = 'en'
+            language_code = _LANG_DISPLAY_TO_CODE.get(self.language_var.get(), 'en')
 
             # Get template setting
             selected_display = self.template_display_var.get()
-            if not selected_display or selected_display not in self.template_mapping:
+            template_id = self.template_mapping.get(selected_display)
+            if template_id is None:
                 messagebox.showerror("Error", "Please select a valid template")
                 return
 
-            template_id = self.template_mapping[selected_display]
-            print(f"Selected template ID: {template_id}, language: {language_code}")
+            log.debug("Selected template ID: %s, language: %s", template_id, language_code)
 
             # Check availability before setting
             available_methods = self.report_manager.get_available_pdf_methods()
@@ -2982,10 +2780,9 @@ class EmployeeTimeApp:
                     if messagebox.askyesno("LaTeX Not Available", install_msg):
                         template_id = 'default'
                         # Update display
-                        for choice in self.template_mapping:
-                            if choice.startswith('Default (ReportLab)'):
-                                self.template_display_var.set(choice)
-                                break
+                        default_display = self.template_id_to_display.get('default')
+                        if default_display:
+                            self.template_display_var.set(default_display)
                     else:
                         return
 
@@ -3004,31 +2801,19 @@ class EmployeeTimeApp:
                                          f"German template for {template_id} not found.\n"
                                          f"Will use English template instead.")
 
-            # Map template IDs to database values
-            template_db_mapping = {
-                'default': 'default',
-                'latex_bw': 'black-white',
-                'latex_color': 'color'
-            }
-
-            db_template_value = template_db_mapping.get(template_id, 'default')
-            print(f"Database values - template: {db_template_value}, language: {language_code}")
+            report_settings = self._collect_report_settings(template_id)
+            log.debug("Database values - template: %s, language: %s",
+                      report_settings['template'], report_settings['lang'])
 
             # Update via SettingsManager
-            success = self.settings_manager.save_report_settings({
-                'template': db_template_value,
-                'lang': language_code,
-                'default_output_path': self.template_output_var.get() if hasattr(self, 'template_output_var') else './reports/'
-            })
+            success = self.settings_manager.save_report_settings(report_settings)
+            # The settings tab no longer matches what was last saved through save_settings
+            self._saved_settings = None
 
             if not success:
                 messagebox.showerror("Error", "Failed to save settings to database")
                 return
 
-            # Verify the settings were saved
-            current_settings = self.settings_manager.get_report_settings()
-            print(f"Verified database settings: {current_settings}")
-
             # Update preview
             self.update_language_preview()
 
@@ -3036,11 +2821,20 @@ class EmployeeTimeApp:
             messagebox.showinfo("Success", f"Settings updated:\n• Language: {language_name}\n• Template: {selected_display.split('(')[0].strip()}")
 
         except Exception as e:
-            print(f"Error applying settings: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Error applying settings")
             messagebox.showerror("Error", f"Failed to apply settings: {e}")
 
+    def _schedule_language_preview(self, *args):
+        """Coalesce language changes into one preview refresh per event loop iteration"""
+        if not self._preview_pending:
+            self._preview_pending = True
+            self.root.after_idle(self._run_language_preview)
+
+    def _run_language_preview(self):
+        """Run the queued language preview refresh"""
+        self._preview_pending = False
+        self.update_language_preview()
+
     def update_language_preview(self, *args):
         """Update the language preview text"""
         if not hasattr(self, 'language_preview_label'):
@@ -3056,8 +2850,6 @@ class EmployeeTimeApp:
 
     def browse_template_output(self):
         """Browse for template output directory"""
-        from tkinter import filedialog
-        
         dir_path = filedialog.askdirectory(
             title="Select Report Output Directory",
             initialdir=self.template_output_var.get()
@@ -3070,6 +2862,49 @@ class EmployeeTimeApp:
  # UTILITY & HELPER METHODS
  # =============================================================================
 
+    def _on_tab_change(self, event=None):
+        """Schedule cache release when leaving a tab, cancel it when coming back"""
+        if self._cache_release_job is not None:
+            self.root.after_cancel(self._cache_release_job)
+            self._cache_release_job = None
+
+        previous_tab = self._current_tab
+        self._current_tab = self.notebook.tab(self.notebook.select(), 'text')
+
+        if previous_tab == "Time Tracking" and self._current_tab != previous_tab:
+            self._cache_release_job = self.root.after(self._cache_release_delay_ms, self._trim_month_records)
+
+    @staticmethod
+    def _set_combo_values(combo, values):
+        """Set a combobox's values unless it already shows exactly these entries"""
+        values = tuple(values)
+        if combo.cget('values') != values:
+            combo['values'] = values
+
+    def _bulk_insert(self, tree, rows):
+        """Replace all rows of a treeview while it is unmapped, so Tk redraws once instead of per row"""
+        manager = tree.winfo_manager()
+        if manager == 'grid':
+            tree.grid_remove()  # grid_remove keeps the grid options for re-adding
+        elif manager == 'pack':
+            pack_info = tree.pack_info()
+            tree.pack_forget()
+
+        try:
+            children = tree.get_children()
+            if children:
+                tree.delete(*children)
+            # Call the Tcl command directly: Tcl converts each tuple to a list natively,
+            # skipping ttk's per-row option formatting in Treeview.insert
+            tk_call, path = tree.tk.call, str(tree)
+            for values in rows:
+                tk_call(path, 'insert', '', 'end', '-values', values)
+        finally:
+            if manager == 'grid':
+                tree.grid()
+            elif manager == 'pack':
+                tree.pack(**pack_info)
+
     def open_calendar(self):
         """Open calendar popup for date selection"""
         try:
@@ -3094,6 +2929,17 @@ class EmployeeTimeApp:
         self.date_year_var.set(today.year)
         self.update_date_display()
 
+    def _schedule_date_display(self, event=None):
+        """Refresh the date display 100 ms after the last keystroke in the date fields"""
+        if self._date_display_job is not None:
+            self.root.after_cancel(self._date_display_job)
+        self._date_display_job = self.root.after(100, self._run_date_display)
+
+    def _run_date_display(self):
+        """Run the debounced date display refresh"""
+        self._date_display_job = None
+        self.update_date_display()
+
     def update_date_display(self):
         """Update the displayed date and store it in self.date_var (YYYY-MM-DD)"""
         try:
@@ -3105,8 +2951,8 @@ class EmployeeTimeApp:
             month = self.date_month_var.get()
             year = self.date_year_var.get()
 
-            # Validate date (basic check)
-            if not (1 <= day <= 31 and 1 <= month <= 12 and year >= 2020):
+            # Validate date against the real length of the month
+            if not (1 <= month <= 12 and year >= 2020 and 1 <= day <= self._days_in(year, month)):
                 raise ValueError("Invalid date range")
 
             # Format as YYYY-MM-DD
@@ -3125,8 +2971,19 @@ class EmployeeTimeApp:
             if hasattr(self, 'date_var'):
                 self.date_var.set("")
 
+    def _days_in(self, year, month):
+        """Number of days in the given month"""
+        return self.date_manager.days_in_month(year, month)
+
     def on_date_component_change(self, *args):
-        """Handle changes to date component spinboxes"""
+        """Handle changes to date component spinboxes 100 ms after the last one, so held arrows reload once"""
+        if self._date_component_job is not None:
+            self.root.after_cancel(self._date_component_job)
+        self._date_component_job = self.root.after(100, self._apply_date_change)
+
+    def _apply_date_change(self):
+        """Run the debounced date component change"""
+        self._date_component_job = None
         try:
             day = self.day_var.get()
             month = self.month_var.get()
@@ -3161,40 +3018,26 @@ class EmployeeTimeApp:
             if not selection:
                 return None
 
-            item = self.emp_tree.item(selection[0])
-
-            print("Treeview item values:", item['values'])
-
-            if not item['values'] or len(item['values']) < 1:
+            # The ID column shows the database row id (see _format_employee_row)
+            displayed_id = self.emp_tree.set(selection[0], 'ID')
+            if not displayed_id.isdigit():
                 return None
 
-            displayed_id = item['values'][0] 
-
-            conn = self.db_manager.get_connection()
-            cursor = conn.cursor()
+            db_id = int(displayed_id)
+            if db_id in self._known_db_ids:
+                return db_id
 
-            try:
-                cursor.execute("SELECT id FROM employees WHERE employee_id = ?", (displayed_id,))
-                result = cursor.fetchone()
-
-                if not result:
-                    try:
-                        cursor.execute("SELECT id FROM employees WHERE id = ?", (int(displayed_id),))
-                        result = cursor.fetchone()
-                    except (ValueError, TypeError):
-                        pass
-
-                if not result:
-                    print(f"Employee with ID {displayed_id} not found in database")
-                    return None
+            # Not in the employee cache (e.g. added elsewhere): confirm the row still exists
+            result = self.db_manager.execute_one(_SQL_EMPLOYEE_DB_ID, (db_id,))
 
-                return result[0]
+            if not result:
+                log.warning("Employee with ID %s not found in database", displayed_id)
+                return None
 
-            finally:
-                conn.close()
+            return result[0]
 
-        except Exception as e:
-            print(f"Error in _get_selected_employee_db_id: {str(e)}")
+        except Exception:
+            log.exception("Error in _get_selected_employee_db_id")
             return None
 
     def on_theme_change(self, *args):
@@ -3234,6 +3077,7 @@ class EmployeeTimeApp:
 # =============================================================================
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
     root = tk.Tk()
     app = EmployeeTimeApp(root)
     root.mainloop()
\ No newline at end of file
@@ -6,15 +6,10 @@ import subprocess
 import os
 import tempfile
 import shutil
-try:
-    from reportlab.lib.pagesizes import letter, A4
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.lib import colors
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
+import importlib.util
+
+# reportlab is only imported when a PDF is actually built with it, see generate_reportlab_pdf_localized
+REPORTLAB_AVAILABLE = importlib.util.find_spec("reportlab") is not None
 
 class ReportManager:
     """
@@ -43,6 +38,10 @@ class ReportManager:
         self.templates_dir = os.path.join(self.script_dir, "resources", "templates")
         self.db_path = db_path
         self.use_reportlab = REPORTLAB_AVAILABLE 
+        # get_company_info result; company data only changes from the settings tab
+        self._company_info = None
+        # Result of the pdflatex probe; LaTeX is not installed mid-session, see refresh_pdf_methods
+        self._latex_available = None
 
     def is_reportlab_available(self) -> bool:
         """Check if reportlab is available for PDF generation."""
@@ -470,6 +469,12 @@ class ReportManager:
         """
         if not REPORTLAB_AVAILABLE:
             raise ImportError("reportlab library not installed. Install with: pip install reportlab")
+
+        from reportlab.lib.pagesizes import A4
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.units import inch
+        from reportlab.lib import colors
         
         try:
             # Get data for the report
@@ -870,13 +875,19 @@ class ReportManager:
         return templates
 
     def _is_latex_available(self) -> bool:
-        """Check if LaTeX is available for PDF generation."""
-        try:
-            subprocess.run(['pdflatex', '--version'], 
-                         capture_output=True, check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        """Check if LaTeX is available for PDF generation (probed once per session)."""
+        if self._latex_available is None:
+            try:
+                subprocess.run(['pdflatex', '--version'], 
+                             capture_output=True, check=True)
+                self._latex_available = True
+            except (subprocess.CalledProcessError, FileNotFoundError):
+                self._latex_available = False
+        return self._latex_available
+
+    def refresh_pdf_methods(self):
+        """Probe for pdflatex again on the next availability check, e.g. after installing LaTeX."""
+        self._latex_available = None
 
     def connect_db(self) -> sqlite3.Connection:
         """Create and return a database connection."""
@@ -919,41 +930,70 @@ class ReportManager:
         Returns:
             List of dictionaries with year, month, month_name, and record_count
         """
+        return self.get_available_months_for_employees([employee_id]).get(employee_id, [])
+
+    def get_available_months_for_employees(self, employee_ids: List[int]) -> Dict[int, List[Dict[str, any]]]:
+        """
+        Get available months with data for several employees in one query.
+        
+        Args:
+            employee_ids: Employee IDs from the database
+            
+        Returns:
+            Dictionary mapping each employee ID that has records to its list of
+            month dictionaries (year, month, month_name, display_name, record_count),
+            newest month first
+        """
+        if not employee_ids:
+            return {}
+
+        placeholders = ','.join('?' * len(employee_ids))
         with self.connect_db() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT DISTINCT 
+            cursor.execute(f"""
+                SELECT 
+                    employee_id,
                     strftime('%Y', date) as year,
                     strftime('%m', date) as month,
                     COUNT(*) as record_count
                 FROM time_records 
-                WHERE employee_id = ?
-                GROUP BY strftime('%Y', date), strftime('%m', date)
-                ORDER BY year DESC, month DESC
-            """, (employee_id,))
+                WHERE employee_id IN ({placeholders})
+                GROUP BY employee_id, strftime('%Y', date), strftime('%m', date)
+                ORDER BY employee_id, year DESC, month DESC
+            """, list(employee_ids))
             
-            months = []
+            months_by_employee = {}
             for row in cursor.fetchall():
                 year = int(row['year'])
                 month = int(row['month'])
                 month_name = calendar.month_name[month]
                 
-                months.append({
+                months_by_employee.setdefault(row['employee_id'], []).append({
                     'year': year,
                     'month': month,
                     'month_name': month_name,
                     'display_name': f"{month_name} {year}",
                     'record_count': row['record_count']
                 })
-            return months
+            return months_by_employee
     
     def get_company_info(self) -> Dict[str, str]:
         """
         Retrieve company information from company_data table.
         
         Returns:
-            Dictionary containing company information
+            Dictionary containing company information (a copy of the cached values)
         """
+        if self._company_info is None:
+            self._company_info = self._read_company_info()
+        return dict(self._company_info)
+
+    def invalidate_company_info(self):
+        """Forget the cached company information after it was changed in the database."""
+        self._company_info = None
+
+    def _read_company_info(self) -> Dict[str, str]:
+        """Read company information from the company_data table, falling back to settings."""
         with self.connect_db() as conn:
             cursor = conn.cursor()
             
@@ -1204,10 +1244,16 @@ class ReportManager:
         """
         print("DEBUG: Calculating summary statistics")
 
-        total_hours = sum(record['hours_worked'] for record in time_records)
-        vacation_days = sum(1 for record in time_records if record['is_vacation'])
-        sick_days = sum(1 for record in time_records if record['is_sick'])
-        total_break_minutes = sum(record['break_minutes'] for record in time_records)
+        # Single pass over the records for all four totals
+        total_hours = 0.0
+        vacation_days = sick_days = total_break_minutes = 0
+        for record in time_records:
+            total_hours += record['hours_worked']
+            total_break_minutes += record['break_minutes']
+            if record['is_vacation']:
+                vacation_days += 1
+            if record['is_sick']:
+                sick_days += 1
 
         print(f"DEBUG: Summary - Total hours: {total_hours:.2f}")
         print(f"DEBUG: Summary - Vacation days: {vacation_days}")
@@ -0,0 +1,122 @@
+"""
+Report preview text for the Reports tab.
+
+The preview only needs ReportManager and plain Python, not Tk, so it can also
+be built by a separate interpreter such as PyPy:
+
+    python report_worker.py DB_PATH EMPLOYEE_ID YEAR MONTH
+
+prints {"report": "<preview text>"} as JSON on stdout. The GUI runs it this way
+when CHRONOSTAFF_REPORT_PYTHON names the interpreter to use.
+"""
+import calendar
+import contextlib
+import json
+import sys
+from operator import itemgetter
+from datetime import datetime
+
+from report_generation import ReportManager
+
+_MONTH_NAMES = tuple(calendar.month_name)
+
+# One time record line of the report preview: date, start, end, hours, break, vacation, sick
+_REPORT_ROW_FMT = "\t\t{:<12} {:<8} {:<8} {:<8} {:<8} {:<10} {:<6}\n".format
+_REPORT_YES_NO = ("No", "Yes")
+_REPORT_HOURS_FMT = "%.1fh".__mod__
+_REPORT_BREAK_FMT = "%dmin".__mod__
+_REPORT_ROW_FIELDS = itemgetter('date', 'start_time', 'end_time', 'hours_worked', 'break_minutes',
+                                'is_vacation', 'is_sick')
+
+
+def build_report_preview(report_manager, employee_id, year, month):
+    """
+    Build the monthly report preview text for one employee.
+
+    Args:
+        report_manager: ReportManager to read company, employee and record data from
+        employee_id: Employee ID from the database
+        year: Report year
+        month: Report month (1-12)
+
+    Returns:
+        Preview text as shown in the Reports tab
+    """
+    employee_info = report_manager.get_employee_info(employee_id)
+    time_records = report_manager.get_time_records(employee_id, year, month)
+    summary = report_manager.calculate_summary(time_records)
+    company_info = report_manager.get_company_info()
+
+    month_name = _MONTH_NAMES[month]
+
+    # Create detailed report preview
+    report_content = f"""
+        MONTHLY TIME REPORT PREVIEW
+        {'=' * 50}
+
+        Company: {company_info['company_name']}
+        Address: {company_info['company_street']}, {company_info['company_city']}
+        Phone: {company_info['company_phone']}
+        Email: {company_info['company_email']}
+
+        Employee Information:
+          Name: {employee_info['name']}
+          Employee ID: {employee_info['employee_number']}
+          Report Period: {month_name} {year}
+
+        SUMMARY:
+          Total Working Hours: {summary['total_hours']:.2f} hours
+          Vacation Days Used: {summary['vacation_days']} day(s)
+          Sick Leave Taken: {summary['sick_days']} day(s)
+          Total Break Time: {summary['total_break_minutes']} minutes
+
+        DETAILED TIME RECORDS:
+        {'─' * 80}
+        {'Date':<12} {'Start':<8} {'End':<8} {'Hours':<8} {'Break':<8} {'Vacation':<10} {'Sick':<6}
+        {'─' * 80}
+        """
+
+    parts = [report_content]
+    for record in time_records:
+        day, start, end, hours_worked, break_minutes, is_vacation, is_sick = _REPORT_ROW_FIELDS(record)
+        hours = _REPORT_HOURS_FMT(hours_worked) if hours_worked > 0 else "-"
+        break_time = _REPORT_BREAK_FMT(break_minutes) if break_minutes > 0 else "-"
+
+        parts.append(_REPORT_ROW_FMT(day, start, end, hours, break_time,
+                                     _REPORT_YES_NO[bool(is_vacation)], _REPORT_YES_NO[bool(is_sick)]))
+
+    parts.append(f"\n\t{'─' * 80}\n")
+    parts.append(f"\tTotal: {summary['total_hours']:.2f} hours worked this month\n")
+
+    if summary['vacation_days'] > 0 or summary['sick_days'] > 0:
+        parts.append("\n\t\tTime Off Summary:\n")
+        if summary['vacation_days'] > 0:
+            parts.append(f"\t\t  • Vacation days: {summary['vacation_days']}\n")
+        if summary['sick_days'] > 0:
+            parts.append(f"\t\t  • Sick days: {summary['sick_days']}\n")
+
+    parts.append("\n\t📄 To generate PDF: Click 'Export PDF' button\n")
+    parts.append(f"\t📊 Report generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    return "".join(parts)
+
+
+def main(argv=None):
+    """Print the preview for DB_PATH EMPLOYEE_ID YEAR MONTH as JSON on stdout."""
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 4:
+        print("usage: report_worker.py DB_PATH EMPLOYEE_ID YEAR MONTH", file=sys.stderr)
+        return 2
+
+    db_path, employee_id, year, month = args[0], int(args[1]), int(args[2]), int(args[3])
+
+    # ReportManager prints its debug output; keep stdout for the result
+    with contextlib.redirect_stdout(sys.stderr):
+        report = build_report_preview(ReportManager(db_path), employee_id, year, month)
+
+    sys.stdout.reconfigure(encoding='utf-8')
+    json.dump({'report': report}, sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())